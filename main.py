@@ -7,24 +7,24 @@ Generates and distributes daily AI news digests using Anthropic's Claude API.
 import sys
 from datetime import datetime
 from src.config import Config
+from src.llm_cache import SemanticLLMCache
 from src.logger import setup_logger
 from src.news_generator import NewsGenerator
-from src.notifiers import EmailNotifier, WebhookNotifier
+from src.notifiers import EmailNotifier, NotifierDispatcher, WebhookNotifier
 
 
 def main():
     """Main application entry point"""
-    try:
-        # Load configuration
-        config = Config()
-
-        # Setup logger with config
-        logger = setup_logger(
-            "ai_news_bot",
-            level=config.log_level,
-            log_format=config.log_format
-        )
+    # Load configuration and set up logging first; the handlers below log
+    # through this logger, so configuration errors propagate as-is
+    config = Config()
+    logger = setup_logger(
+        "ai_news_bot",
+        level=config.log_level_int,
+        log_format=config.log_format
+    )
 
+    try:
         logger.info("=" * 60)
         logger.info("AI News Bot Starting")
         logger.info(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -34,7 +34,16 @@ def main():
 
         # Initialize news generator
         logger.info("Initializing news generator...")
-        news_gen = NewsGenerator(enable_web_search=config.enable_web_search)
+        semantic_cache = None
+        if config.semantic_cache_enabled:
+            semantic_cache = SemanticLLMCache(
+                threshold=config.semantic_cache_threshold,
+                ttl=config.semantic_cache_ttl
+            )
+        news_gen = NewsGenerator(
+            enable_web_search=config.enable_web_search,
+            semantic_cache=semantic_cache
+        )
 
         # Generate news digest
         logger.info("Generating AI news digest...")
@@ -70,30 +79,31 @@ def main():
         notification_methods = config.notification_methods
         logger.info(f"Enabled notification methods: {notification_methods}")
 
-        # Track notification results
-        results = {"sent": [], "failed": []}
-
-        # Send email notification if enabled
+        # Build the enabled notifiers
+        notifiers = {}
         if "email" in notification_methods:
-            logger.info("Sending email notification...")
-            email_notifier = EmailNotifier()
-            if email_notifier.send(news_digest):
-                results["sent"].append("email")
-                logger.info("Email notification sent successfully")
-            else:
-                results["failed"].append("email")
-                logger.warning("Email notification failed")
-
-        # Send webhook notification if enabled
+            notifiers["email"] = EmailNotifier()
         if "webhook" in notification_methods:
-            logger.info("Sending webhook notification...")
-            webhook_notifier = WebhookNotifier()
-            if webhook_notifier.send(news_digest):
-                results["sent"].append("webhook")
-                logger.info("Webhook notification sent successfully")
+            notifiers["webhook"] = WebhookNotifier()
+
+        # Send all notifications concurrently
+        if notifiers:
+            logger.info(f"Sending notifications: {', '.join(notifiers)}")
+        dispatcher = NotifierDispatcher(notifiers)
+        try:
+            send_results = dispatcher.send_all(news_digest)
+        finally:
+            dispatcher.close()
+
+        # Track notification results
+        results = {"sent": [], "failed": []}
+        for method, ok in send_results.items():
+            if ok:
+                results["sent"].append(method)
+                logger.info(f"{method.capitalize()} notification sent successfully")
             else:
-                results["failed"].append("webhook")
-                logger.warning("Webhook notification failed")
+                results["failed"].append(method)
+                logger.warning(f"{method.capitalize()} notification failed")
 
         # Summary
         logger.info("=" * 60)
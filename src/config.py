@@ -1,19 +1,33 @@
 """
 Configuration management for AI News Bot
 """
+import copy
+import json
+import logging
 import os
-import yaml
-from typing import Dict, List, Any, Optional
+import tempfile
+from collections import OrderedDict
+from functools import cached_property
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from dotenv import load_dotenv
 from .logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
+# Parsed YAML keyed by resolved path, validated against (mtime, size)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 
 class Config:
-    """Application configuration manager"""
+    """
+    Application configuration manager.
+
+    Values are read once and memoized on the instance, including those
+    taken from environment variables; construct a new Config to pick up
+    changes to the environment or config file.
+    """
 
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -23,12 +37,19 @@ class Config:
             config_path: Path to config.yaml file. If None, searches for it in default locations
         """
         # Load environment variables from .env file
+        from dotenv import load_dotenv
+
         load_dotenv()
 
         # Find and load YAML config
         self.config_path = self._find_config_file(config_path)
         self.config_data = self._load_yaml_config()
 
+        # Resolve environment-derived settings once per instance
+        self._notification_methods = self._read_notification_methods()
+        self._ai_response_language = os.getenv("AI_RESPONSE_LANGUAGE", "en").strip().lower()
+        self._enable_web_search = self._read_enable_web_search()
+
         logger.info(f"Configuration loaded from {self.config_path}")
 
     def _find_config_file(self, config_path: Optional[str] = None) -> Path:
@@ -50,20 +71,23 @@ class Config:
                 return path
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        # Search in default locations
-        search_paths = [
-            Path("config.yaml"),
-            Path("config.yml"),
-            Path(__file__).parent.parent / "config.yaml",
-            Path(__file__).parent.parent / "config.yml",
-        ]
+        # Search in default locations, reading each directory once
+        candidates = ("config.yaml", "config.yml")
+        search_dirs = [Path("."), Path(__file__).parent.parent]
 
-        for path in search_paths:
-            if path.exists():
-                return path
+        for directory in search_dirs:
+            try:
+                with os.scandir(directory) as it:
+                    found = {entry.name for entry in it if entry.name in candidates and entry.is_file()}
+            except OSError:
+                continue
+            for name in candidates:
+                if name in found:
+                    return directory / name
 
         raise FileNotFoundError(
-            "Config file not found. Searched: " + ", ".join(str(p) for p in search_paths)
+            "Config file not found. Searched: "
+            + ", ".join(str(d / name) for d in search_dirs for name in candidates)
         )
 
     def _load_yaml_config(self) -> Dict[str, Any]:
@@ -74,21 +98,92 @@ class Config:
             Configuration dictionary
         """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                return config or {}
+            st = self.config_path.stat()
+            key = str(self.config_path.resolve())
+
+            cached = _YAML_CACHE.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+                _YAML_CACHE.move_to_end(key)
+                return copy.deepcopy(cached[2])
+
+            use_sidecar = os.getenv("CONFIG_CACHE", "").strip() == "1"
+            config = self._read_json_sidecar(st.st_mtime) if use_sidecar else None
+
+            if config is None:
+                import yaml
+
+                try:
+                    from yaml import CSafeLoader as _YamlLoader
+                except ImportError:  # PyYAML built without libyaml
+                    from yaml import SafeLoader as _YamlLoader
+
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=_YamlLoader) or {}
+                if use_sidecar:
+                    self._write_json_sidecar(config)
+
+            _YAML_CACHE[key] = (st.st_mtime, st.st_size, config)
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+
+            return copy.deepcopy(config)
         except Exception as e:
             logger.error(f"Failed to load config file: {str(e)}")
             return {}
 
-    @property
+    @cached_property
+    def _json_sidecar_path(self) -> Path:
+        """Path of the JSON cache written next to the YAML config"""
+        return self.config_path.with_suffix(self.config_path.suffix + ".cache.json")
+
+    def _read_json_sidecar(self, yaml_mtime: float) -> Optional[Dict[str, Any]]:
+        """
+        Load the JSON sidecar cache if it is at least as new as the YAML file.
+
+        Args:
+            yaml_mtime: Modification time of the YAML config
+
+        Returns:
+            Cached configuration dictionary, or None if missing or stale
+        """
+        cache_path = self._json_sidecar_path
+        try:
+            if cache_path.stat().st_mtime < yaml_mtime:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            return config if isinstance(config, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_json_sidecar(self, config: Dict[str, Any]) -> None:
+        """
+        Atomically write the parsed config to the JSON sidecar cache.
+
+        Args:
+            config: Parsed configuration dictionary
+        """
+        cache_path = self._json_sidecar_path
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write config cache {cache_path}: {str(e)}")
+
+    @cached_property
     def news_topics(self) -> List[str]:
         """Get list of news topics to cover"""
         return self.config_data.get("news", {}).get("topics", [
             "Latest AI developments and breakthroughs"
         ])
 
-    @property
+    @cached_property
     def news_prompt_template(self) -> str:
         """Get the prompt template for news generation"""
         default_template = """You are an AI news curator. Please provide a concise daily digest of AI news and developments.
@@ -107,12 +202,28 @@ Format your response as a structured news digest with clear sections."""
 
         return self.config_data.get("news", {}).get("prompt_template", default_template)
 
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Get logging level"""
         return self.config_data.get("logging", {}).get("level", "INFO")
 
-    @property
+    @cached_property
+    def log_level_int(self) -> int:
+        """
+        Get logging level as its numeric value.
+
+        Raises:
+            ValueError: If the configured level is not a known level name
+        """
+        level = logging.getLevelNamesMapping().get(str(self.log_level).upper())
+        if level is None:
+            raise ValueError(
+                f"Invalid logging.level '{self.log_level}' in {self.config_path}; "
+                f"expected one of DEBUG, INFO, WARNING, ERROR, CRITICAL"
+            )
+        return level
+
+    @cached_property
     def log_format(self) -> str:
         """Get logging format"""
         return self.config_data.get("logging", {}).get(
@@ -120,22 +231,15 @@ Format your response as a structured news digest with clear sections."""
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-    @property
-    def notification_methods(self) -> List[str]:
-        """Get enabled notification methods from environment"""
+    def _read_notification_methods(self) -> List[str]:
+        """Parse enabled notification methods from environment"""
         methods_str = os.getenv("NOTIFICATION_METHODS", "")
         if not methods_str:
             return []
         return [m.strip().lower() for m in methods_str.split(",")]
 
-    @property
-    def ai_response_language(self) -> str:
-        """Get the language for AI-generated content"""
-        return os.getenv("AI_RESPONSE_LANGUAGE", "en").strip().lower()
-
-    @property
-    def enable_web_search(self) -> bool:
-        """Get whether to enable web search for fetching current news"""
+    def _read_enable_web_search(self) -> bool:
+        """Resolve the web search flag from config file or environment"""
         # Check config file first, then environment variable
         config_value = self.config_data.get("news", {}).get("enable_web_search")
         if config_value is not None:
@@ -144,20 +248,50 @@ Format your response as a structured news digest with clear sections."""
         return env_value in ("true", "1", "yes", "on")
 
     @property
+    def notification_methods(self) -> List[str]:
+        """Get enabled notification methods from environment"""
+        return self._notification_methods
+
+    @property
+    def ai_response_language(self) -> str:
+        """Get the language for AI-generated content"""
+        return self._ai_response_language
+
+    @property
+    def enable_web_search(self) -> bool:
+        """Get whether to enable web search for fetching current news"""
+        return self._enable_web_search
+
+    @cached_property
     def use_real_news_sources(self) -> bool:
         """Whether to fetch real-time news from RSS feeds"""
         return self.config_data.get("news", {}).get("use_real_sources", True)
 
-    @property
+    @cached_property
     def include_chinese_sources(self) -> bool:
         """Whether to include Chinese news sources"""
         return self.config_data.get("news", {}).get("include_chinese_sources", True)
 
-    @property
+    @cached_property
     def max_items_per_source(self) -> int:
         """Maximum news items to fetch per source"""
         return self.config_data.get("news", {}).get("max_items_per_source", 5)
 
+    @cached_property
+    def semantic_cache_enabled(self) -> bool:
+        """Whether to reuse responses for near-identical prompts"""
+        return bool(self.config_data.get("cache", {}).get("semantic", {}).get("enabled", False))
+
+    @cached_property
+    def semantic_cache_threshold(self) -> float:
+        """Minimum topic similarity for a semantic cache hit"""
+        return float(self.config_data.get("cache", {}).get("semantic", {}).get("threshold", 0.92))
+
+    @cached_property
+    def semantic_cache_ttl(self) -> float:
+        """Semantic cache entry lifetime in seconds"""
+        return float(self.config_data.get("cache", {}).get("semantic", {}).get("ttl", 86400))
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by key.
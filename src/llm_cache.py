@@ -0,0 +1,257 @@
+"""
+On-disk cache for generated LLM responses
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union
+from .logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "llm_cache"
+
+
+class LLMCache:
+    """Cache LLM responses as JSON files keyed by a SHA-256 of the request"""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries. Defaults to data/llm_cache
+                in the project root
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """
+        Build a deterministic cache key from request parameters.
+
+        Args:
+            *parts: Values that identify the request (model, prompt, language, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Path of the cache entry for a key"""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response, or None if missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] > entry["ttl"]:
+                return None
+            return entry["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to read LLM cache entry {key}: {str(e)}")
+            return None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """
+        Store a response atomically.
+
+        Args:
+            key: Cache key from make_key
+            value: Response text
+            ttl: Time to live in seconds
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"created": time.time(), "ttl": ttl, "value": value}, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {key}: {str(e)}")
+
+
+class SemanticLLMCache:
+    """
+    Cache LLM responses by text similarity rather than exact match.
+
+    The varying part of a request (e.g. its topics) is embedded locally with
+    hashed character trigrams, so near-identical requests ("Large language
+    model research" vs "Large language models research") share an entry
+    without calling an embedding service. Embed only that part: shared
+    boilerplate such as a prompt template dominates the similarity.
+    Everything else that shapes the response belongs in the scope, which
+    must match exactly. Requires numpy; the cache is disabled if it is not
+    installed.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        threshold: float = 0.92,
+        ttl: float = 86400,
+        dim: int = 1024
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            path: .npz file holding the cache. Defaults to data/llm_cache/semantic.npz
+            threshold: Minimum cosine similarity for a hit
+            ttl: Time to live in seconds
+            dim: Embedding dimension
+        """
+        try:
+            import numpy
+        except ImportError:
+            logger.warning("numpy not installed, semantic LLM cache disabled")
+            numpy = None
+
+        self._np = numpy
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "semantic.npz"
+        self.threshold = threshold
+        self.ttl = ttl
+        self.dim = dim
+        self._loaded = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is usable"""
+        return self._np is not None
+
+    def _embed(self, text: str):
+        """Embed text as an L2-normalized hashed character-trigram vector"""
+        np = self._np
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for word in text.lower().split():
+            padded = f" {word} "
+            for i in range(len(padded) - 2):
+                digest = hashlib.blake2b(padded[i:i + 3].encode("utf-8"), digest_size=8).digest()
+                vec[int.from_bytes(digest, "little") % self.dim] += 1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def _load(self) -> None:
+        """Load persisted entries on first use"""
+        np = self._np
+        self._embeddings = np.zeros((0, self.dim), dtype=np.float32)
+        self._scopes = []
+        self._created = []
+        self._responses = []
+        self._loaded = True
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if data["embeddings"].shape[1] != self.dim:
+                    return
+                self._embeddings = data["embeddings"]
+                self._scopes = data["scopes"].tolist()
+                self._created = data["created"].tolist()
+                self._responses = data["responses"].tolist()
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to load semantic LLM cache: {str(e)}")
+
+    def _save(self) -> None:
+        """Persist entries atomically"""
+        np = self._np
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".npz")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(
+                        f,
+                        embeddings=self._embeddings,
+                        scopes=np.array(self._scopes, dtype=str),
+                        created=np.array(self._created, dtype=np.float64),
+                        responses=np.array(self._responses, dtype=str)
+                    )
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write semantic LLM cache: {str(e)}")
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL"""
+        now = time.time()
+        keep = [i for i, created in enumerate(self._created) if now - created <= self.ttl]
+        if len(keep) == len(self._created):
+            return
+        self._embeddings = self._embeddings[keep]
+        self._scopes = [self._scopes[i] for i in keep]
+        self._created = [self._created[i] for i in keep]
+        self._responses = [self._responses[i] for i in keep]
+
+    def get(self, scope: str, text: str) -> Optional[str]:
+        """
+        Look up a response for similar text.
+
+        Args:
+            scope: Key that must match exactly (e.g. from LLMCache.make_key)
+            text: Text compared by similarity, such as the requested topics
+
+        Returns:
+            Cached response for the most similar text, or None
+        """
+        if not self.enabled:
+            return None
+        if not self._loaded:
+            self._load()
+        self._evict_expired()
+        if not self._responses:
+            return None
+
+        np = self._np
+        scores = self._embeddings @ self._embed(text)
+        scores[np.array(self._scopes) != scope] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            logger.info(f"Semantic LLM cache hit (similarity {scores[best]:.3f})")
+            return self._responses[best]
+        return None
+
+    def set(self, scope: str, text: str, response: str) -> None:
+        """
+        Store a response for a text.
+
+        Args:
+            scope: Key that must match exactly on lookup
+            text: Text compared by similarity on lookup
+            response: Response text
+        """
+        if not self.enabled:
+            return
+        if not self._loaded:
+            self._load()
+        self._evict_expired()
+
+        self._embeddings = self._np.vstack([self._embeddings, self._embed(text)])
+        self._scopes.append(scope)
+        self._created.append(time.time())
+        self._responses.append(response)
+        self._save()
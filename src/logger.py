@@ -3,32 +3,51 @@ Logging configuration for the AI News Bot
 """
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional, Union
+
+
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "FATAL", "CRITICAL")
+}
+
+# Loggers whose handler has already been attached by setup_logger, keyed by name
+_LOGGERS: Dict[str, logging.Logger] = {}
 
 
 def setup_logger(
     name: str,
-    level: str = "INFO",
+    level: Union[int, str] = "INFO",
     log_format: Optional[str] = None
 ) -> logging.Logger:
     """
     Set up a logger with the specified configuration.
 
+    Repeated calls for the same name skip the handler setup but still
+    re-apply the requested level.
+
     Args:
         name: Logger name
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL) or numeric level
         log_format: Custom log format string
 
     Returns:
         Configured logger instance
     """
+    lvl = level if isinstance(level, int) else _LEVELS[level.upper()]
+
+    logger = _LOGGERS.get(name)
+    if logger is not None:
+        logger.setLevel(lvl)
+        return logger
+
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(lvl)
 
     # Avoid adding multiple handlers if logger already exists
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(getattr(logging, level.upper()))
+        handler.setLevel(lvl)
 
         # Default format if none provided
         if log_format is None:
@@ -38,4 +57,5 @@ def setup_logger(
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
+    _LOGGERS[name] = logger
     return logger
@@ -158,30 +158,24 @@ class NewsFetcher:
         Returns:
             Formatted news text
         """
-        formatted = "# Recent AI News Items to Summarize\n\n"
+        parts = ["# Recent AI News Items to Summarize\n\n"]
 
-        if news_data['international']:
-            formatted += "## International News\n\n"
-            for i, item in enumerate(news_data['international'], 1):
-                formatted += f"### {i}. {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
-                if item['description']:
-                    formatted += f"**Description:** {item['description'][:300]}...\n"
-                formatted += f"**Link:** {item['link']}\n"
-                if item['published']:
-                    formatted += f"**Published:** {item['published']}\n"
-                formatted += "\n"
-
-        if news_data['domestic']:
-            formatted += "## Domestic (Chinese) News\n\n"
-            for i, item in enumerate(news_data['domestic'], 1):
-                formatted += f"### {i}. {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
+        sections = (
+            ("International News", news_data['international']),
+            ("Domestic (Chinese) News", news_data['domestic']),
+        )
+        for heading, items in sections:
+            if not items:
+                continue
+            parts.append(f"## {heading}\n\n")
+            for i, item in enumerate(items, 1):
+                parts.append(f"### {i}. {item['title']}\n")
+                parts.append(f"**Source:** {item['source']}\n")
                 if item['description']:
-                    formatted += f"**Description:** {item['description'][:300]}...\n"
-                formatted += f"**Link:** {item['link']}\n"
+                    parts.append(f"**Description:** {item['description'][:300]}...\n")
+                parts.append(f"**Link:** {item['link']}\n")
                 if item['published']:
-                    formatted += f"**Published:** {item['published']}\n"
-                formatted += "\n"
+                    parts.append(f"**Published:** {item['published']}\n")
+                parts.append("\n")
 
-        return formatted
+        return "".join(parts)
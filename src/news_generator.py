@@ -1,27 +1,363 @@
 """
 AI News Generator using Anthropic API
 """
+import asyncio
 import os
-from typing import Dict, List, Optional
-from anthropic import Anthropic
+import random
+import re
+import string
+import time
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple
 from .logger import setup_logger
-from .web_search import WebSearchTool, get_search_tool_definition
+from .llm_cache import LLMCache, SemanticLLMCache
 from .news_fetcher import NewsFetcher
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
 
 logger = setup_logger(__name__)
 
+# Anthropic clients shared across NewsGenerator instances, keyed by API key
+_CLIENTS: Dict[str, "Anthropic"] = {}
+
+
+def _get_anthropic_client(api_key: str) -> "Anthropic":
+    """
+    Get the process-wide Anthropic client for an API key, creating it on first use.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Shared Anthropic client backed by a keep-alive connection pool
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        # Imported lazily to keep CLI startup fast
+        from anthropic import DEFAULT_CONNECTION_LIMITS, Anthropic, DefaultHttpxClient
+
+        # Long keep-alive so back-to-back agent loop and retry requests reuse
+        # connections. Limits comes from the HTTP library the SDK is built on,
+        # and the SDK's default timeout is kept for long non-streaming calls
+        limits = type(DEFAULT_CONNECTION_LIMITS)(
+            max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0
+        )
+        http_client = DefaultHttpxClient(limits=limits)
+        client = _CLIENTS.setdefault(api_key, Anthropic(api_key=api_key, http_client=http_client))
+    return client
+
+
+def close_clients() -> None:
+    """
+    Close every pooled Anthropic client in the process.
+
+    Intended for process shutdown: every NewsGenerator created before the
+    call keeps a reference to its closed client and fails on its next
+    request. Generators created afterwards get a new client.
+    """
+    while _CLIENTS:
+        _, client = _CLIENTS.popitem()
+        client.close()
+
+
+# Display names for non-English response languages
+_LANGUAGE_NAMES: Mapping[str, str] = MappingProxyType({
+    "zh": "Chinese (中文)",
+    "es": "Spanish (Español)",
+    "fr": "French (Français)",
+    "ja": "Japanese (日本語)",
+    "de": "German (Deutsch)",
+    "ko": "Korean (한국어)",
+    "pt": "Portuguese (Português)",
+    "ru": "Russian (Русский)",
+    "ar": "Arabic (العربية)",
+    "hi": "Hindi (हिन्दी)",
+    "it": "Italian (Italiano)",
+    "nl": "Dutch (Nederlands)",
+})
+
+# Prompt suffixes instructing Claude to answer in a given language
+_LANG_SUFFIX: Mapping[str, str] = MappingProxyType({
+    code: f"\n\nIMPORTANT: Please respond entirely in {name}."
+    for code, name in _LANGUAGE_NAMES.items()
+})
+
+
+def _language_suffix(language: Optional[str]) -> str:
+    """Return the prompt suffix for a language code, or "" for English"""
+    if not language:
+        return ""
+    code = language.lower()
+    if code == "en":
+        return ""
+    suffix = _LANG_SUFFIX.get(code)
+    if suffix is None:
+        suffix = f"\n\nIMPORTANT: Please respond entirely in {language.upper()}."
+    return suffix
+
+
+@lru_cache(maxsize=16)
+def _split_template(prompt_template: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a template around its {topics} placeholder.
+
+    Args:
+        prompt_template: Template string with {topics} placeholder
+
+    Returns:
+        (prefix, suffix) tuple, or None if the template needs str.format
+        (no placeholder, other fields, or escaped braces)
+    """
+    prefix, sep, suffix = prompt_template.partition("{topics}")
+    if not sep or "{" in prefix or "}" in prefix or "{" in suffix or "}" in suffix:
+        return None
+    return prefix, suffix
+
+
+@lru_cache(maxsize=32)
+def _build_prompt(topics: Tuple[str, ...], prompt_template: str) -> str:
+    """
+    Fill the {topics} placeholder of a prompt template with a bulleted list.
+
+    Args:
+        topics: Topics to cover, as a hashable tuple
+        prompt_template: Template string with {topics} placeholder
+
+    Returns:
+        Formatted prompt. Placeholders other than {topics} are left empty
+    """
+    topics_formatted = "\n".join(f"- {topic}" for topic in topics)
+    split = _split_template(prompt_template)
+    if split is None:
+        return prompt_template.format_map(defaultdict(str, topics=topics_formatted))
+    prefix, suffix = split
+    return prefix + topics_formatted + suffix
+
+
+def _format_search_results(query: str, search_results: List[Dict[str, str]]) -> str:
+    """
+    Format web search results as tool result text for Claude.
+
+    Args:
+        query: Search query string
+        search_results: Results returned by WebSearchTool
+
+    Returns:
+        Formatted result text
+    """
+    if not search_results:
+        return f"No results found for '{query}'. Try a different query or proceed with the information you have."
+
+    parts = [f"Search results for '{query}':\n\n"]
+    for i, result in enumerate(search_results, 1):
+        parts.append(f"{i}. {result['title']}\n   {result['snippet']}\n")
+        if result['url']:
+            parts.append(f"   URL: {result['url']}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+def _compact_tool_results(
+    messages: List[Dict],
+    summaries: Mapping[str, str],
+    keep_messages: int = 4
+) -> None:
+    """
+    Replace search results in older agent loop turns with one-line summaries.
+
+    Every request resends the whole conversation, so full results from
+    early searches would be paid for again on each later iteration. The
+    initial prompt and the last keep_messages messages (the two most recent
+    assistant/tool_result turns) are left verbatim.
+
+    Args:
+        messages: Conversation messages, modified in place
+        summaries: One-line summary for each tool_use_id
+        keep_messages: Number of trailing messages to leave untouched
+    """
+    for msg in messages[1:-keep_messages]:
+        if msg["role"] != "user" or not isinstance(msg["content"], list):
+            continue
+        for block in msg["content"]:
+            summary = summaries.get(block.get("tool_use_id"))
+            if summary is not None:
+                block["content"] = summary
+
+
+def _first_text(blocks) -> Optional[str]:
+    """Return the text of the first text block in a message's content, if any"""
+    return next((block.text for block in blocks if block.type == "text"), None)
+
+
+@lru_cache(maxsize=1)
+def _cached_search_tools() -> List[Dict]:
+    """
+    Get the tools list for web search, marked for prompt caching.
+
+    The cache_control breakpoint on the (only) tool caches the tool schema
+    prefix, so agent loop iterations after the first read it from the
+    prompt cache. Built once and shared; callers must not mutate it.
+
+    Returns:
+        Tools list for the Anthropic API
+    """
+    from .web_search import get_search_tool_definition
+
+    return [{**get_search_tool_definition(), "cache_control": {"type": "ephemeral"}}]
+
+
+def _cached_user_content(static_prefix: str, dynamic_suffix: str = "") -> List[Dict]:
+    """
+    Build user message content with the static prefix marked for prompt caching.
+
+    Anthropic caches everything up to the marked block (tools included), so
+    repeated requests with the same prefix, such as agent loop iterations,
+    are billed and served at the cached rate.
+
+    Args:
+        static_prefix: Prompt text that is identical across requests
+        dynamic_suffix: Text appended after the cached prefix, if any
+
+    Returns:
+        List of content blocks for a user message
+    """
+    content = [{"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}}]
+    if dynamic_suffix:
+        content.append({"type": "text", "text": dynamic_suffix})
+    return content
+
+
+# Prompt suffix asking Claude to gather news with the web_search tool
+_WEB_SEARCH_INSTRUCTION = "\n\nIMPORTANT: Use the web_search tool to find the most recent AI news from 2025. You can search 3-5 times with different queries to gather diverse news. After gathering news, create a comprehensive digest based on what you found."
+
+# The SDK rejects non-streaming requests whose max_tokens could take over
+# 10 minutes to generate (it assumes 128k output tokens per hour)
+_MAX_NONSTREAMING_TOKENS = 128_000 * 10 // 60
+
+# Section delimiter for multilingual digests, one per language
+_LANG_SECTION_RE = re.compile(r"^===LANG:([\w-]+)===[ \t]*$", re.MULTILINE)
+
+# Prompt for summarizing fetched news; the user-supplied instructions are
+# substituted as-is, so braces in them need no escaping
+_SUMMARIZATION_TEMPLATE = string.Template("""Based on the following recent AI news articles, create a well-organized news digest.
+
+$formatted_news
+
+Instructions:
+$instructions
+
+CRITICAL REQUIREMENTS:
+- SELECT ONLY THE TOP 10 MOST IMPORTANT news items from all the items provided above
+- Quality over quantity - prioritize groundbreaking, high-impact news
+- Avoid duplicate or overly similar news items
+- Focus on cutting-edge developments and industry-shaping events
+- Maintain accuracy - only include information from the provided articles
+- Format the output in clean, readable markdown
+- Include source attributions as clickable markdown links: [Source Name](URL)
+- Use the **Link:** field from each news item to create the clickable source link
+- Example: "Source: [TechCrunch](https://techcrunch.com/article-url)" or "来源: [网站名称](URL)"
+""")
+
+# Response cache lifetimes: knowledge-based digests can be reused for a day,
+# digests built from live news (web search, RSS) should stay fresh
+_CACHE_TTL = 86400
+_LIVE_CACHE_TTL = 3600
+
+# HTTP statuses worth retrying (timeouts, rate limits, server errors, overload)
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504, 529})
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an Anthropic API error is transient and worth retrying"""
+    import anthropic
+
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in _RETRYABLE_STATUS
+    return False
+
+
+def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse the server-requested retry delay from response headers.
+
+    Args:
+        headers: HTTP response headers
+
+    Returns:
+        Delay in seconds, or None if the headers do not specify one
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Compute the delay before the next retry attempt.
+
+    Honors a Retry-After (or retry-after-ms) header when the server sends
+    one, otherwise uses exponential backoff with full jitter.
+
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Zero-based index of the failed attempt
+
+    Returns:
+        Delay in seconds
+    """
+    import anthropic
+
+    if isinstance(error, anthropic.APIStatusError):
+        requested = _retry_after(error.response.headers)
+        if requested is not None:
+            return min(_RETRY_MAX_DELAY, max(0.0, requested))
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+
 
 class NewsGenerator:
     """Generate AI news digest using Anthropic's Claude API"""
 
-    def __init__(self, api_key: Optional[str] = None, enable_web_search: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        enable_web_search: bool = False,
+        semantic_cache: Optional[SemanticLLMCache] = None
+    ):
         """
         Initialize the NewsGenerator.
 
         Args:
             api_key: Anthropic API key. If None, will read from ANTHROPIC_API_KEY env var
             enable_web_search: Whether to enable web search tool for fetching current news
+            semantic_cache: Optional similarity-based response cache, consulted by
+                generate_news_digest after the exact-match cache misses. Matches on the
+                topics only, within the same model, template, language and day. Not used
+                with web search or for digests from fetched news
 
         Raises:
             ValueError: If API key is not provided and not in environment
@@ -32,11 +368,48 @@ class NewsGenerator:
                 "Anthropic API key must be provided or set in ANTHROPIC_API_KEY environment variable"
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # Reuse the pooled client so its HTTP connections survive across instances
+        self.client = _get_anthropic_client(self.api_key)
         self.enable_web_search = enable_web_search
-        self.search_tool = WebSearchTool() if enable_web_search else None
+        if enable_web_search:
+            from .web_search import WebSearchTool
+
+            self.search_tool = WebSearchTool()
+            self._tools = _cached_search_tools()
+        else:
+            self.search_tool = None
+            self._tools = None
         self.news_fetcher = NewsFetcher()
-        logger.info(f"NewsGenerator initialized successfully (web_search: {enable_web_search})")
+        self.llm_cache = LLMCache()
+        self.semantic_cache = semantic_cache
+        self.cache_enabled = os.getenv("LLM_CACHE", "true").strip().lower() not in ("false", "0", "no", "off")
+        logger.info("NewsGenerator initialized successfully (web_search: %s)", enable_web_search)
+
+    def _create_message(
+        self,
+        stream: bool,
+        on_token: Optional[Callable[[str], None]] = None,
+        **kwargs
+    ):
+        """
+        Call the Messages API, optionally streaming the response.
+
+        Args:
+            stream: Whether to stream the response
+            on_token: Called with each text chunk as it arrives (streaming only)
+            **kwargs: Arguments passed to messages.create / messages.stream
+
+        Returns:
+            The complete Message, including its stop_reason
+        """
+        if not stream:
+            return self.client.messages.create(**kwargs)
+
+        with self.client.messages.stream(**kwargs) as s:
+            if on_token is not None:
+                for text in s.text_stream:
+                    on_token(text)
+            return s.get_final_message()
 
     def generate_news_digest(
         self,
@@ -44,7 +417,10 @@ class NewsGenerator:
         prompt_template: str,
         model: str = "claude-sonnet-4-5-20250929",
         max_tokens: int = 2000,
-        language: str = "en"
+        language: str = "en",
+        stream: bool = False,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[float] = None
     ) -> str:
         """
         Generate a news digest based on provided topics.
@@ -56,6 +432,10 @@ class NewsGenerator:
             model: Claude model to use
             max_tokens: Maximum tokens in response
             language: Language code for the response (e.g., 'en', 'zh', 'es', 'fr', 'ja')
+            stream: Stream the response from the API instead of waiting for the full message
+            cache_enabled: Reuse a cached digest for identical requests on the same day.
+                Defaults to the LLM_CACHE environment setting
+            cache_ttl: Cache lifetime in seconds. Defaults to one day, or one hour with web search
 
         Returns:
             Generated news digest as string
@@ -64,74 +444,72 @@ class NewsGenerator:
             Exception: If API call fails
         """
         try:
-            # Format topics as a bulleted list
-            topics_formatted = "\n".join([f"- {topic}" for topic in topics])
+            use_cache = self.cache_enabled if cache_enabled is None else cache_enabled
+            if use_cache:
+                cache_key = LLMCache.make_key(
+                    "digest", model, sorted(topics), prompt_template, language,
+                    max_tokens, self.enable_web_search, date.today().isoformat()
+                )
+                cached = self.llm_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached news digest")
+                    return cached
 
-            # Create the full prompt
-            prompt = prompt_template.format(topics=topics_formatted)
+            # Create the full prompt (cached, so retries reuse the same string)
+            prompt_parts = [_build_prompt(tuple(topics), prompt_template)]
 
             # Add web search instruction if enabled
             if self.enable_web_search:
-                prompt += "\n\nIMPORTANT: Use the web_search tool to find the most recent AI news from 2025. You can search 3-5 times with different queries to gather diverse news. After gathering news, create a comprehensive digest based on what you found."
-
-            # Add language instruction if not English
-            language_names = {
-                "zh": "Chinese (中文)",
-                "es": "Spanish (Español)",
-                "fr": "French (Français)",
-                "ja": "Japanese (日本語)",
-                "de": "German (Deutsch)",
-                "ko": "Korean (한국어)",
-                "pt": "Portuguese (Português)",
-                "ru": "Russian (Русский)",
-                "ar": "Arabic (العربية)",
-                "hi": "Hindi (हिन्दी)",
-                "it": "Italian (Italiano)",
-                "nl": "Dutch (Nederlands)",
-            }
-
-            if language and language.lower() != "en":
-                language_name = language_names.get(language.lower(), language.upper())
-                prompt += f"\n\nIMPORTANT: Please respond entirely in {language_name}."
-
-            logger.info(f"Generating news digest with model: {model}, language: {language}, web_search: {self.enable_web_search}")
-            logger.debug(f"Topics: {topics}")
-
-            # Prepare messages and tools
-            messages = [{"role": "user", "content": prompt}]
-            tools = [get_search_tool_definition()] if self.enable_web_search else None
+                prompt_parts.append(_WEB_SEARCH_INSTRUCTION)
+
+            static_prompt = "".join(prompt_parts)
+            language_suffix = _language_suffix(language)
+
+            # Only the topics are compared by similarity; everything else that shapes the
+            # digest must match exactly. Web search digests go stale within the hour, so
+            # they are left to the exact-match cache and its shorter TTL
+            use_semantic_cache = use_cache and self.semantic_cache is not None and not self.enable_web_search
+            if use_semantic_cache:
+                semantic_scope = LLMCache.make_key(
+                    "digest", model, prompt_template, language, max_tokens, date.today().isoformat()
+                )
+                semantic_topics = "\n".join(topics)
+                cached = self.semantic_cache.get(semantic_scope, semantic_topics)
+                if cached is not None:
+                    return cached
+
+            # Static instructions form the prompt-cached prefix; the language
+            # instruction (if not English) follows uncached
+            prompt_content = _cached_user_content(static_prompt, language_suffix)
+
+            logger.info(
+                "Generating news digest with model: %s, language: %s, web_search: %s",
+                model, language, self.enable_web_search
+            )
+            logger.debug("Topics: %s", topics)
+
+            # Prepare messages and request parameters shared by every iteration
+            messages = [{"role": "user", "content": prompt_content}]
+            request_kwargs = {"model": model, "max_tokens": max_tokens, "messages": messages}
+            if self._tools:
+                request_kwargs["tools"] = self._tools
 
             # Agentic loop for tool use
-            response_text = None
             max_iterations = 8  # Limit iterations to prevent excessive searches
             search_count = 0
             max_searches = 6  # Limit total number of searches
+            # Normalized query -> (formatted results, one-line summary)
+            seen_searches: Dict[str, Tuple[str, str]] = {}
+            search_summaries: Dict[str, str] = {}  # tool_use_id -> one-line summary
 
             for iteration in range(max_iterations):
                 # Call Anthropic API
-                if tools:
-                    message = self.client.messages.create(
-                        model=model,
-                        max_tokens=max_tokens,
-                        messages=messages,
-                        tools=tools
-                    )
-                else:
-                    message = self.client.messages.create(
-                        model=model,
-                        max_tokens=max_tokens,
-                        messages=messages
-                    )
+                message = self._create_message(stream, **request_kwargs)
 
-                logger.debug(f"Iteration {iteration + 1}: stop_reason = {message.stop_reason}")
+                logger.debug("Iteration %d: stop_reason = %s", iteration + 1, message.stop_reason)
 
                 # Check if we got a final response
                 if message.stop_reason == "end_turn":
-                    # Extract text from content blocks
-                    for block in message.content:
-                        if block.type == "text":
-                            response_text = block.text
-                            break
                     break
 
                 # Check if Claude wants to use a tool
@@ -142,38 +520,40 @@ class NewsGenerator:
                         "content": message.content
                     })
 
-                    # Process tool calls
+                    # Collect tool calls, deferring the searches so they run concurrently
                     tool_results = []
+                    pending_searches = []
+                    pending_keys = set()
+                    repeated_searches = []
                     for block in message.content:
                         if block.type == "tool_use":
                             tool_name = block.name
                             tool_input = block.input
 
-                            logger.info(f"Tool call: {tool_name} with input: {tool_input}")
+                            logger.info("Tool call: %s with input: %s", tool_name, tool_input)
 
                             # Execute the tool
                             if tool_name == "web_search" and self.search_tool:
-                                search_count += 1
-
-                                # Check if we've exceeded max searches
-                                if search_count > max_searches:
-                                    result_text = "Maximum number of searches reached. Please create the digest based on the information gathered so far."
+                                query = tool_input.get("query", "AI news 2025")
+                                max_results = min(tool_input.get("max_results", 10), 10)
+                                key = query.strip().lower()
+
+                                if key in seen_searches:
+                                    # Repeated query: reuse the earlier results without a new search
+                                    result_text, search_summaries[block.id] = seen_searches[key]
+                                elif key in pending_keys:
+                                    repeated_searches.append((len(tool_results), key))
+                                    result_text = None
                                 else:
-                                    query = tool_input.get("query", "AI news 2025")
-                                    max_results = tool_input.get("max_results", 10)
-                                    search_results = self.search_tool.search_news(query, max_results)
-
-                                    # Format search results
-                                    if search_results:
-                                        result_text = f"Search results for '{query}':\n\n"
-                                        for i, result in enumerate(search_results, 1):
-                                            result_text += f"{i}. {result['title']}\n"
-                                            result_text += f"   {result['snippet']}\n"
-                                            if result['url']:
-                                                result_text += f"   URL: {result['url']}\n"
-                                            result_text += "\n"
+                                    search_count += 1
+
+                                    # Check if we've exceeded max searches
+                                    if search_count > max_searches:
+                                        result_text = "Maximum number of searches reached. Please create the digest based on the information gathered so far."
                                     else:
-                                        result_text = f"No results found for '{query}'. Try a different query or proceed with the information you have."
+                                        pending_searches.append((len(tool_results), query, max_results))
+                                        pending_keys.add(key)
+                                        result_text = None
 
                                 tool_results.append({
                                     "type": "tool_result",
@@ -181,19 +561,41 @@ class NewsGenerator:
                                     "content": result_text
                                 })
 
+                    # Run this turn's searches concurrently, keeping tool_use_id order
+                    if pending_searches:
+                        all_results = self.search_tool.search_news_concurrently(
+                            [(query, max_results) for _, query, max_results in pending_searches]
+                        )
+                        turn_results = {}
+                        for (index, query, _), search_results in zip(pending_searches, all_results):
+                            key = query.strip().lower()
+                            result_text = _format_search_results(query, search_results)
+                            summary = f"[Earlier search for '{query}' returned {len(search_results)} results]"
+                            tool_results[index]["content"] = result_text
+                            search_summaries[tool_results[index]["tool_use_id"]] = summary
+                            turn_results[key] = (result_text, summary)
+                            if search_results:
+                                seen_searches[key] = (result_text, summary)
+                        for index, key in repeated_searches:
+                            result_text, summary = turn_results[key]
+                            tool_results[index]["content"] = result_text
+                            search_summaries[tool_results[index]["tool_use_id"]] = summary
+
                     # Add tool results to messages
                     if tool_results:
                         messages.append({
                             "role": "user",
                             "content": tool_results
                         })
+                        # Claude has already read older results; resend them as summaries
+                        _compact_tool_results(messages, search_summaries)
                     else:
                         # No valid tool results, break
                         break
 
                     # Force generation after max searches
                     if search_count >= max_searches:
-                        logger.info(f"Reached max searches ({max_searches}), forcing final generation")
+                        logger.info("Reached max searches (%d), forcing final generation", max_searches)
                         # Add a message to prompt Claude to generate final output
                         messages.append({
                             "role": "user",
@@ -203,18 +605,20 @@ class NewsGenerator:
                     # Unexpected stop reason
                     break
 
-            # If we didn't get a response through the loop, extract from last message
-            if response_text is None:
-                for block in message.content:
-                    if block.type == "text":
-                        response_text = block.text
-                        break
-
+            # Extract text from the last message's content blocks
+            response_text = _first_text(message.content)
             if response_text is None:
                 raise Exception("No text response received from Claude")
 
             logger.info("News digest generated successfully")
-            logger.debug(f"Response length: {len(response_text)} characters")
+            logger.debug("Response length: %d characters", len(response_text))
+
+            if use_cache:
+                if cache_ttl is None:
+                    cache_ttl = _LIVE_CACHE_TTL if self.enable_web_search else _CACHE_TTL
+                self.llm_cache.set(cache_key, response_text, cache_ttl)
+                if use_semantic_cache:
+                    self.semantic_cache.set(semantic_scope, semantic_topics, response_text)
 
             return response_text
 
@@ -232,6 +636,9 @@ class NewsGenerator:
         """
         Generate news digest with retry logic.
 
+        Only transient API failures (connection errors, 408/429/5xx) are
+        retried, with exponential backoff and jitter between attempts.
+
         Args:
             topics: List of topics to cover
             prompt_template: Template string with {topics} placeholder
@@ -242,7 +649,7 @@ class NewsGenerator:
             Generated news digest as string
 
         Raises:
-            Exception: If all retries fail
+            Exception: If all retries fail or the error is not retryable
         """
         last_exception = None
 
@@ -250,14 +657,201 @@ class NewsGenerator:
             try:
                 return self.generate_news_digest(topics, prompt_template, **kwargs)
             except Exception as e:
+                if not _is_retryable(e):
+                    raise
                 last_exception = e
                 logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
                 if attempt < max_retries - 1:
-                    logger.info("Retrying...")
+                    delay = _retry_delay(e, attempt)
+                    logger.info("Retrying in %.1fs...", delay)
+                    time.sleep(delay)
 
         logger.error(f"All {max_retries} attempts failed")
         raise last_exception
 
+    def generate_multilingual_digest(
+        self,
+        topics: List[str],
+        prompt_template: str,
+        languages: List[str],
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, str]:
+        """
+        Generate the digest in several languages with a single API call.
+
+        The shared instructions (and any web search) are processed once; Claude
+        writes one section per language, delimited by '===LANG:<code>===' lines,
+        which are split client-side. Languages missing from the response are
+        generated individually.
+
+        Args:
+            topics: List of topics to cover in the news digest
+            prompt_template: Template string with {topics} placeholder
+            languages: Language codes to produce (e.g. ['en', 'zh', 'ja'])
+            max_tokens: Maximum tokens in the combined response.
+                Defaults to 2000 per language. Above what the SDK allows
+                without streaming, the combined request is streamed
+            **kwargs: Additional arguments passed to generate_news_digest,
+                except language
+
+        Returns:
+            Mapping of language code to digest
+
+        Raises:
+            ValueError: If language is passed instead of languages
+        """
+        if "language" in kwargs:
+            raise ValueError("generate_multilingual_digest takes languages, not language")
+
+        codes = [language.lower() for language in languages]
+        if len(codes) == 1:
+            if max_tokens is not None:
+                kwargs["max_tokens"] = max_tokens
+            return {codes[0]: self.generate_news_digest(topics, prompt_template, language=codes[0], **kwargs)}
+
+        language_list = ", ".join(
+            f"{code} ({'English' if code == 'en' else _LANGUAGE_NAMES.get(code, code.upper())})"
+            for code in codes
+        )
+        multilingual_template = (
+            prompt_template
+            + "\n\nIMPORTANT: Output the complete digest in each of the following languages. "
+            + "Precede each version with a line containing only '===LANG:<code>===' "
+            + f"and write nothing outside these sections: {language_list}"
+        )
+
+        combined_max_tokens = max_tokens or 2000 * len(codes)
+        combined_kwargs = dict(kwargs)
+        if combined_max_tokens > _MAX_NONSTREAMING_TOKENS:
+            combined_kwargs["stream"] = True
+
+        text = self.generate_news_digest(
+            topics,
+            multilingual_template,
+            max_tokens=combined_max_tokens,
+            language="en",
+            **combined_kwargs
+        )
+
+        # re.split yields [preamble, code1, body1, code2, body2, ...]
+        parts = _LANG_SECTION_RE.split(text)
+        digests = {}
+        for code, body in zip(parts[1::2], parts[2::2]):
+            body = body.strip()
+            if body:
+                digests[code.lower()] = body
+
+        missing = [code for code in codes if code not in digests]
+        if missing:
+            logger.warning("Multilingual digest missing sections for %s, generating individually", missing)
+            for code in missing:
+                digests[code] = self.generate_news_digest(topics, prompt_template, language=code, **kwargs)
+
+        return {code: digests[code] for code in codes}
+
+    async def _generate_shard(
+        self,
+        client: "AsyncAnthropic",
+        topics: List[str],
+        prompt_template: str,
+        model: str,
+        max_tokens: int,
+        language: str
+    ) -> str:
+        """
+        Generate the digest section for one shard of topics.
+
+        Args:
+            client: Async Anthropic client to issue the request with
+            topics: Topics covered by this shard
+            prompt_template: Template string with {topics} placeholder
+            model: Claude model to use
+            max_tokens: Maximum tokens in response
+            language: Language code for the response
+
+        Returns:
+            Generated digest section as string
+        """
+        prompt = _build_prompt(tuple(topics), prompt_template) + _language_suffix(language)
+        message = await client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        response_text = _first_text(message.content)
+        if response_text is None:
+            raise Exception("No text response received from Claude")
+        return response_text
+
+    async def generate_parallel(
+        self,
+        topics: List[str],
+        prompt_template: str,
+        shard_size: int = 3,
+        model: str = "claude-sonnet-4-5-20250929",
+        max_tokens: int = 2000,
+        language: str = "en"
+    ) -> str:
+        """
+        Generate a news digest by splitting topics into shards requested concurrently.
+
+        Each shard is a separate API call, so this trades extra tokens for
+        lower wall-clock time on long topic lists. Web search is not used.
+
+        Args:
+            topics: List of topics to cover in the news digest
+            prompt_template: Template string with {topics} placeholder
+            shard_size: Number of topics per request
+            model: Claude model to use
+            max_tokens: Maximum tokens in each shard's response
+            language: Language code for the response
+
+        Returns:
+            Generated news digest as string
+
+        Raises:
+            Exception: If any shard fails
+        """
+        from anthropic import AsyncAnthropic
+
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+
+        shards = [topics[i:i + shard_size] for i in range(0, len(topics), shard_size)]
+        logger.info("Generating news digest in %d parallel requests with model: %s", len(shards), model)
+
+        # The client is scoped to this event loop; its connection pool cannot
+        # outlive the loop created by asyncio.run
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            results = await asyncio.gather(*(
+                self._generate_shard(client, shard, prompt_template, model, max_tokens, language)
+                for shard in shards
+            ))
+
+        logger.info("News digest generated successfully")
+        return "\n\n".join(results)
+
+    def generate_news_digest_parallel(
+        self,
+        topics: List[str],
+        prompt_template: str,
+        **kwargs
+    ) -> str:
+        """
+        Synchronous wrapper around generate_parallel.
+
+        Args:
+            topics: List of topics to cover
+            prompt_template: Template string with {topics} placeholder
+            **kwargs: Additional arguments passed to generate_parallel
+
+        Returns:
+            Generated news digest as string
+        """
+        return asyncio.run(self.generate_parallel(topics, prompt_template, **kwargs))
+
     def generate_news_digest_from_sources(
         self,
         prompt_template: str,
@@ -265,7 +859,11 @@ class NewsGenerator:
         max_tokens: int = 4000,
         language: str = "en",
         include_chinese: bool = True,
-        max_items_per_source: int = 5
+        max_items_per_source: int = 5,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[float] = None
     ) -> str:
         """
         Fetch real-time news and generate a digest based on actual news articles.
@@ -277,6 +875,12 @@ class NewsGenerator:
             language: Language code for the response
             include_chinese: Whether to include Chinese news sources
             max_items_per_source: Maximum items to fetch per source
+            stream: Stream the response from the API instead of waiting for the full message
+            on_token: Called with each chunk of the digest as it is generated, so
+                downstream work can start early. Implies stream. Not called on cache hits
+            cache_enabled: Reuse a cached digest for identical requests on the same day.
+                Defaults to the LLM_CACHE environment setting
+            cache_ttl: Cache lifetime in seconds. Defaults to one hour
 
         Returns:
             Generated news digest as string
@@ -285,6 +889,17 @@ class NewsGenerator:
             Exception: If fetching or generation fails
         """
         try:
+            use_cache = self.cache_enabled if cache_enabled is None else cache_enabled
+            if use_cache:
+                cache_key = LLMCache.make_key(
+                    "sources_digest", model, prompt_template, language, max_tokens,
+                    include_chinese, max_items_per_source, date.today().isoformat()
+                )
+                cached = self.llm_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached news digest")
+                    return cached
+
             # Fetch real-time news
             logger.info("Fetching real-time AI news from sources...")
             news_data = self.news_fetcher.fetch_recent_news(
@@ -300,68 +915,65 @@ class NewsGenerator:
                     prompt_template=prompt_template,
                     model=model,
                     max_tokens=max_tokens,
-                    language=language
+                    language=language,
+                    stream=stream,
+                    cache_enabled=cache_enabled,
+                    cache_ttl=cache_ttl
                 )
 
             # Format news for summarization
             formatted_news = self.news_fetcher.format_news_for_summary(news_data)
 
-            # Create summarization prompt
-            summarization_prompt = f"""Based on the following recent AI news articles, create a well-organized news digest.
+            # The request-level key above changes daily; this one tracks the
+            # fetched news itself, so a rerun over unchanged feeds skips the call
+            if use_cache:
+                news_key = LLMCache.make_key(
+                    "sources_news", model, formatted_news, prompt_template, language, max_tokens
+                )
+                cached = self.llm_cache.get(news_key)
+                if cached is not None:
+                    logger.info("News items unchanged since the last run, reusing its digest")
+                    return cached
 
-{formatted_news}
+            # Create summarization prompt
+            summarization_prompt = _SUMMARIZATION_TEMPLATE.substitute(
+                formatted_news=formatted_news,
+                instructions=prompt_template
+            )
 
-Instructions:
-{prompt_template}
+            language_suffix = _language_suffix(language)
 
-CRITICAL REQUIREMENTS:
-- SELECT ONLY THE TOP 10 MOST IMPORTANT news items from all the items provided above
-- Quality over quantity - prioritize groundbreaking, high-impact news
-- Avoid duplicate or overly similar news items
-- Focus on cutting-edge developments and industry-shaping events
-- Maintain accuracy - only include information from the provided articles
-- Format the output in clean, readable markdown
-- Include source attributions as clickable markdown links: [Source Name](URL)
-- Use the **Link:** field from each news item to create the clickable source link
-- Example: "Source: [TechCrunch](https://techcrunch.com/article-url)" or "来源: [网站名称](URL)"
-"""
+            # Add language instruction if not English, after the cached prefix
+            summarization_content = _cached_user_content(summarization_prompt, language_suffix)
 
-            # Add language instruction if not English
-            language_names = {
-                "zh": "Chinese (中文)",
-                "es": "Spanish (Español)",
-                "fr": "French (Français)",
-                "ja": "Japanese (日本語)",
-                "de": "German (Deutsch)",
-                "ko": "Korean (한국어)",
-                "pt": "Portuguese (Português)",
-                "ru": "Russian (Русский)",
-                "ar": "Arabic (العربية)",
-                "hi": "Hindi (हिन्दी)",
-                "it": "Italian (Italiano)",
-                "nl": "Dutch (Nederlands)",
-            }
-
-            if language and language.lower() != "en":
-                language_name = language_names.get(language.lower(), language.upper())
-                summarization_prompt += f"\n\nIMPORTANT: Please respond entirely in {language_name}."
-
-            logger.info(f"Generating summary from {len(news_data['international']) + len(news_data['domestic'])} news items")
+            logger.info(
+                "Generating summary from %d news items",
+                len(news_data['international']) + len(news_data['domestic'])
+            )
 
             # Call Anthropic API
-            message = self.client.messages.create(
+            message = self._create_message(
+                stream or on_token is not None,
+                on_token,
                 model=model,
                 max_tokens=max_tokens,
                 messages=[
-                    {"role": "user", "content": summarization_prompt}
+                    {"role": "user", "content": summarization_content}
                 ]
             )
 
             # Extract the response text
-            response_text = message.content[0].text
+            response_text = _first_text(message.content)
+            if response_text is None:
+                raise Exception("No text response received from Claude")
 
             logger.info("News digest generated successfully from real sources")
-            logger.debug(f"Response length: {len(response_text)} characters")
+            logger.debug("Response length: %d characters", len(response_text))
+
+            if use_cache:
+                ttl = _LIVE_CACHE_TTL if cache_ttl is None else cache_ttl
+                self.llm_cache.set(cache_key, response_text, ttl)
+                self.llm_cache.set(news_key, response_text, ttl)
 
             return response_text
 
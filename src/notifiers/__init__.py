@@ -3,5 +3,6 @@ Notification modules for AI News Bot
 """
 from .email_notifier import EmailNotifier
 from .webhook_notifier import WebhookNotifier
+from .dispatch import NotifierDispatcher, send_concurrently
 
-__all__ = ["EmailNotifier", "WebhookNotifier"]
+__all__ = ["EmailNotifier", "WebhookNotifier", "NotifierDispatcher", "send_concurrently"]
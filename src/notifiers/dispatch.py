@@ -0,0 +1,77 @@
+"""
+Concurrent dispatch of notifications
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+def send_concurrently(sends: Dict[str, Callable[[], bool]]) -> Dict[str, bool]:
+    """
+    Run notification sends in parallel threads.
+
+    Notifier sends are blocking network I/O, so running them in threads
+    makes the total latency that of the slowest notifier rather than
+    the sum of all of them.
+
+    Args:
+        sends: Mapping of notifier name to a zero-argument callable that
+            performs the send and returns True on success
+
+    Returns:
+        Mapping of notifier name to whether its send succeeded
+    """
+    if not sends:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(sends)) as executor:
+        futures = {name: executor.submit(send) for name, send in sends.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = bool(future.result())
+            except Exception as e:
+                logger.error(f"Unexpected error sending {name} notification: {str(e)}")
+                results[name] = False
+
+    return results
+
+
+class NotifierDispatcher:
+    """Send one digest through several notifiers concurrently"""
+
+    def __init__(self, notifiers: Mapping[str, Any]):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            notifiers: Mapping of notifier name to notifier instance. Each
+                notifier's send(content, subject) returns True on success
+        """
+        self.notifiers = dict(notifiers)
+
+    def send_all(self, content: str, subject: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Send content through every notifier in parallel.
+
+        Args:
+            content: Notification content (news digest)
+            subject: Subject or title. If None, each notifier uses its default
+
+        Returns:
+            Mapping of notifier name to whether its send succeeded
+        """
+        return send_concurrently({
+            name: (lambda notifier=notifier: notifier.send(content, subject))
+            for name, notifier in self.notifiers.items()
+        })
+
+    def close(self) -> None:
+        """Close every notifier that holds pooled connections"""
+        for notifier in self.notifiers.values():
+            close = getattr(notifier, "close", None)
+            if close is not None:
+                close()
@@ -1,16 +1,502 @@
 """
 Email notification module using Resend.com service
 """
+import atexit
+import html
+import logging
 import os
-import resend
-from typing import Optional
-from datetime import datetime
+import random
+import re
+import threading
+import time
+import uuid
+import requests
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from ..logger import setup_logger
+from .utils import default_title
 
 
 logger = setup_logger(__name__)
 
 
+class _KeepAliveHTTPClient:
+    """
+    HTTP client for the Resend SDK that reuses one requests.Session.
+
+    The SDK's default client calls requests.request(), opening a new
+    TCP+TLS connection for every email. This keeps connections alive
+    between sends and rebuilds the session after a connection failure.
+    """
+
+    def __init__(self, timeout: int = 30):
+        """
+        Initialize the client.
+
+        Args:
+            timeout: Request timeout in seconds
+        """
+        self._timeout = timeout
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared session, creating it on first use"""
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        """Perform a request; signature matches resend.HTTPClient.request"""
+        session = self._get_session()
+        try:
+            resp = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json if data is None and files is None else None,
+                files=files,
+                data=data,
+                timeout=self._timeout,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.ConnectionError as e:
+            # Drop the pooled connections so the next send reconnects cleanly
+            self.close()
+            raise RuntimeError(f"Request failed: {e}") from e
+        except requests.RequestException as e:
+            raise RuntimeError(f"Request failed: {e}") from e
+
+    def close(self) -> None:
+        """Close the session and its pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_HTTP_CLIENT = _KeepAliveHTTPClient()
+atexit.register(_HTTP_CLIENT.close)
+
+# Most emails Resend accepts in one batch request
+_BATCH_SIZE = 100
+
+# Default Resend API request rate, per second
+_DEFAULT_RATE_LIMIT = 2.0
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that blocks callers to hold a request rate"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Reserve the token now so concurrent callers queue behind it
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+# Retry policy for Resend sends: attempts after the first, and backoff bounds in seconds
+_SEND_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+_RETRY_JITTER = 0.5
+
+# 429 error types that will not clear within a retry window
+_QUOTA_ERROR_TYPES = frozenset({"daily_quota_exceeded", "monthly_quota_exceeded"})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Whether a failed Resend send is transient and worth retrying.
+
+    Rate limiting (429), server errors (5xx) and network failures, which the
+    SDK reports as code 500, are retryable; invalid keys, validation errors
+    and exhausted quotas are not.
+    """
+    import resend
+
+    if not isinstance(error, resend.exceptions.ResendError):
+        return False
+    if getattr(error, "error_type", None) in _QUOTA_ERROR_TYPES:
+        return False
+    try:
+        status = int(error.code)
+    except (TypeError, ValueError):
+        return False
+    return status == 429 or status >= 500
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Compute the delay before the next send attempt.
+
+    Honors a Retry-After header when Resend sends one, otherwise uses
+    exponential backoff with up to _RETRY_JITTER proportional jitter.
+
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Zero-based index of the failed attempt
+
+    Returns:
+        Delay in seconds
+    """
+    headers = getattr(error, "headers", None) or {}
+    # The SDK copies the response headers into a plain dict, keeping their case
+    retry_after = next((value for name, value in headers.items() if name.lower() == "retry-after"), None)
+    if retry_after:
+        try:
+            return min(_RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    delay = _RETRY_BASE_DELAY * 2 ** attempt * (1 + random.uniform(0, _RETRY_JITTER))
+    return min(_RETRY_MAX_DELAY, delay)
+
+
+def _send_with_retry(send: Callable[[], Any], rate_limiter: Optional[_TokenBucket] = None) -> Any:
+    """
+    Make a Resend API call, retrying transient failures with backoff.
+
+    Network failures, read timeouts included, are retried even though
+    Resend may already have accepted the request, so send must pass the
+    same idempotency key on every attempt for Resend to drop duplicates.
+
+    Args:
+        send: Zero-argument callable performing the API call
+        rate_limiter: Bucket to take a token from before every attempt
+
+    Returns:
+        Resend API response
+
+    Raises:
+        Exception: If the error is not retryable or all retries fail
+    """
+    for attempt in range(_SEND_MAX_RETRIES + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return send()
+        except Exception as e:
+            if attempt == _SEND_MAX_RETRIES or not _is_retryable(e):
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(
+                f"Resend send attempt {attempt + 1} failed ({str(e)}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+
+# Email HTML shell; only the $subject and $content slots vary per send
+_HTML_SHELL = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'PingFang SC', 'Microsoft YaHei', Helvetica, Arial, sans-serif;
+            line-height: 1.8;
+            color: #24292e;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f6f8fa;
+        }
+        .container {
+            background-color: #ffffff;
+            border-radius: 8px;
+            padding: 40px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .title {
+            color: #0366d6;
+            font-size: 32px;
+            font-weight: 700;
+            margin-bottom: 20px;
+            padding-bottom: 15px;
+            border-bottom: 4px solid #0366d6;
+            text-align: center;
+        }
+        .content {
+            margin-top: 30px;
+        }
+        .content h1 {
+            color: #0366d6;
+            font-size: 28px;
+            font-weight: 700;
+            margin-top: 40px;
+            margin-bottom: 20px;
+            padding-bottom: 12px;
+            border-bottom: 3px solid #0366d6;
+        }
+        .content h2 {
+            color: #2c3e50;
+            font-size: 22px;
+            font-weight: 600;
+            margin-top: 35px;
+            margin-bottom: 18px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e1e4e8;
+        }
+        .content h3 {
+            color: #24292e;
+            font-size: 18px;
+            font-weight: 600;
+            margin-top: 28px;
+            margin-bottom: 15px;
+            padding-left: 12px;
+            border-left: 4px solid #0366d6;
+        }
+        .content h4 {
+            color: #586069;
+            font-size: 16px;
+            font-weight: 600;
+            margin-top: 20px;
+            margin-bottom: 12px;
+        }
+        .content p {
+            margin: 15px 0;
+            line-height: 1.8;
+            color: #24292e;
+        }
+        .content ul, .content ol {
+            margin: 15px 0;
+            padding-left: 30px;
+        }
+        .content li {
+            margin: 10px 0;
+            line-height: 1.8;
+        }
+        .content strong {
+            font-weight: 600;
+            color: #0366d6;
+        }
+        .content em {
+            font-style: italic;
+            color: #586069;
+        }
+        .content code {
+            background-color: #f6f8fa;
+            padding: 3px 6px;
+            border-radius: 3px;
+            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+            font-size: 0.9em;
+            color: #d73a49;
+        }
+        .content pre {
+            background-color: #f6f8fa;
+            padding: 16px;
+            border-radius: 6px;
+            overflow-x: auto;
+            border: 1px solid #e1e4e8;
+        }
+        .content pre code {
+            background-color: transparent;
+            padding: 0;
+            color: #24292e;
+        }
+        .content blockquote {
+            margin: 20px 0;
+            padding: 10px 20px;
+            border-left: 4px solid #dfe2e5;
+            background-color: #f6f8fa;
+            color: #586069;
+        }
+        .content hr {
+            border: none;
+            border-top: 2px solid #e1e4e8;
+            margin: 30px 0;
+        }
+        .content a {
+            color: #0366d6;
+            text-decoration: none;
+            border-bottom: 1px solid transparent;
+            transition: border-bottom 0.2s;
+        }
+        .content a:hover {
+            border-bottom: 1px solid #0366d6;
+        }
+        .content table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        .content th, .content td {
+            border: 1px solid #e1e4e8;
+            padding: 10px 15px;
+            text-align: left;
+        }
+        .content th {
+            background-color: #f6f8fa;
+            font-weight: 600;
+        }
+        .footer {
+            margin-top: 50px;
+            padding-top: 25px;
+            border-top: 2px solid #e1e4e8;
+            text-align: center;
+            font-size: 14px;
+            color: #586069;
+        }
+        .footer p {
+            margin: 8px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="title">$subject</div>
+        <div class="content">
+            $content
+        </div>
+    </div>
+    <div class="footer">
+        <p>This email was automatically generated by AI News Bot</p>
+        <p>Powered by Anthropic Claude</p>
+    </div>
+</body>
+</html>
+'''
+
+# The shell split at its two slots, so rendering is a plain join
+_HTML_PREFIX, _HTML_REST = _HTML_SHELL.split("$subject")
+_HTML_MIDDLE, _HTML_SUFFIX = _HTML_REST.split("$content")
+
+# Patterns for the fallback markdown renderer, applied to HTML-escaped text
+_RE_HEADER = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$", re.MULTILINE)
+_RE_BULLET_RUN = re.compile(r"(?:^[ \t]*[-*+][ \t]+.+(?:\n[ \t]+\S.*)*(?:\n|$))+", re.MULTILINE)
+_RE_BULLET = re.compile(r"^[ \t]*[-*+][ \t]+(.+(?:\n[ \t]+\S.*)*)", re.MULTILINE)
+_RE_NUMBERED_RUN = re.compile(r"(?:^[ \t]*\d+[.)][ \t]+.+(?:\n[ \t]+\S.*)*(?:\n|$))+", re.MULTILINE)
+_RE_NUMBERED = re.compile(r"^[ \t]*\d+[.)][ \t]+(.+(?:\n[ \t]+\S.*)*)", re.MULTILINE)
+_RE_CONTINUATION = re.compile(r"[ \t]*\n[ \t]+")
+_RE_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_RE_ITALIC = re.compile(r"(?<![*\w])\*(?![\s*])(.+?)(?<![\s*])\*(?![*\w])")
+_RE_LINK = re.compile(r'\[([^\]]+)\]\((https?://[^)\s"]+)\)')
+_RE_HR = re.compile(r"^[ \t]*(?:-{3,}|\*{3,}|_{3,})[ \t]*$", re.MULTILINE)
+_RE_TEXT_LINE = re.compile(r"^(?![ \t]*<(?:h[1-6]|ul|/ul|ol|/ol|li|hr)\b).*\S.*$", re.MULTILINE)
+
+
+def _wrap_list(tag: str, item_re: "re.Pattern[str]", run: str) -> str:
+    """Convert a run of list lines (with indented continuations) into an HTML list"""
+    items = (
+        "<li>" + _RE_CONTINUATION.sub("<br>", m.group(1).rstrip()) + "</li>"
+        for m in item_re.finditer(run)
+    )
+    return f"<{tag}>\n" + "\n".join(items) + f"\n</{tag}>\n"
+
+
+def _render_markdown_basic(content: str) -> str:
+    """
+    Render the common markdown subset Claude produces without the markdown library.
+
+    Supports headers, bullet and numbered lists, bold, italic, links and
+    horizontal rules; other lines become text followed by <br>.
+
+    Args:
+        content: Markdown formatted content
+
+    Returns:
+        HTML fragment
+    """
+    text = html.escape(content, quote=False)
+    text = _RE_HR.sub("<hr>", text)
+    text = _RE_HEADER.sub(lambda m: f"<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>", text)
+    text = _RE_BULLET_RUN.sub(lambda m: _wrap_list("ul", _RE_BULLET, m.group(0)), text)
+    text = _RE_NUMBERED_RUN.sub(lambda m: _wrap_list("ol", _RE_NUMBERED, m.group(0)), text)
+    text = _RE_LINK.sub(r'<a href="\2">\1</a>', text)
+    text = _RE_BOLD.sub(r"<strong>\1</strong>", text)
+    text = _RE_ITALIC.sub(r"<em>\1</em>", text)
+    return _RE_TEXT_LINE.sub(r"\g<0><br>", text)
+
+
+# python-markdown converter, built on first use and reset between documents.
+# None until first use, False if the library is not installed
+_MARKDOWN: Any = None
+_MARKDOWN_LOCK = threading.Lock()
+_MARKDOWN_EXTENSIONS = [
+    'nl2br',       # Convert newlines to <br>
+    'tables',      # Support for tables
+    'fenced_code', # Support for code blocks
+    'sane_lists',  # Better list handling
+]
+
+
+def _render_markdown(content: str) -> Optional[str]:
+    """
+    Render markdown with the shared python-markdown converter.
+
+    Building a Markdown instance registers every extension's processors,
+    so one instance is reused and reset per document instead. Conversion
+    is serialized because the instance holds per-document state.
+
+    Args:
+        content: Markdown formatted content
+
+    Returns:
+        HTML fragment, or None if the markdown library is not installed
+    """
+    global _MARKDOWN
+    with _MARKDOWN_LOCK:
+        if _MARKDOWN is None:
+            try:
+                import markdown
+                _MARKDOWN = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+            except ImportError:
+                _MARKDOWN = False
+        if _MARKDOWN is False:
+            return None
+        return _MARKDOWN.reset().convert(content)
+
+
+@lru_cache(maxsize=8)
+def _render_html(content: str, subject: str) -> str:
+    """
+    Render the full HTML email, memoized so resending a digest is free.
+
+    Args:
+        content: Markdown formatted content
+        subject: Email subject
+
+    Returns:
+        HTML formatted email
+    """
+    html_content = _render_markdown(content)
+    if html_content is None:
+        logger.warning("markdown library not installed, using basic HTML formatting")
+        html_content = _render_markdown_basic(content)
+
+    return "".join((_HTML_PREFIX, html.escape(subject), _HTML_MIDDLE, html_content, _HTML_SUFFIX))
+
+
 class EmailNotifier:
     """Send email notifications with AI news digest using Resend.com"""
 
@@ -18,7 +504,7 @@ class EmailNotifier:
         self,
         resend_api_key: Optional[str] = None,
         email_from: Optional[str] = None,
-        email_to: Optional[str] = None
+        email_to: Optional[Union[str, List[str]]] = None
     ):
         """
         Initialize EmailNotifier with Resend.com.
@@ -26,22 +512,24 @@ class EmailNotifier:
         Args:
             resend_api_key: Resend API key
             email_from: Sender email address (must be verified in Resend)
-            email_to: Recipient email address
+            email_to: Recipient email address, or several as a list or comma-separated string
 
         All parameters default to environment variables if not provided.
         """
         self.resend_api_key = resend_api_key or os.getenv("RESEND_API_KEY")
         self.email_from = email_from or os.getenv("EMAIL_FROM")
-        self.email_to = email_to or os.getenv("EMAIL_TO")
+        self.email_to = self._parse_recipients(email_to or os.getenv("EMAIL_TO"))
 
-        # Set the Resend API key
-        if self.resend_api_key:
-            resend.api_key = self.resend_api_key
-        else:
+        # Stay under Resend's per-key request rate; sends above it are rejected
+        rate = self._read_rate_limit()
+        self._bucket = _TokenBucket(rate, max(1.0, rate))
+
+        if not self.resend_api_key:
             logger.warning("Resend API key not configured")
 
         # Validate required fields
-        if not all([self.resend_api_key, self.email_from, self.email_to]):
+        self._configured = bool(self.resend_api_key and self.email_from and self.email_to)
+        if not self._configured:
             logger.warning(
                 "Email notifier not fully configured. "
                 "Required: RESEND_API_KEY, EMAIL_FROM, EMAIL_TO"
@@ -49,50 +537,181 @@ class EmailNotifier:
 
         logger.info(f"EmailNotifier initialized with Resend.com (from: {self.email_from})")
 
-    def send(self, content: str, subject: Optional[str] = None) -> bool:
+    def send(self, content: str, subject: Optional[str] = None, include_html: bool = True) -> bool:
         """
         Send email notification with news digest using Resend.
 
         Args:
             content: Email body content (news digest)
             subject: Email subject. If None, uses default with current date
+            include_html: Include the rendered HTML version. If False, only the plain
+                text is sent and markdown rendering is skipped
 
         Returns:
             True if email sent successfully, False otherwise
         """
-        if not all([self.resend_api_key, self.email_from, self.email_to]):
+        if not self._configured:
             logger.error("Email notifier is not fully configured. Skipping email send.")
             return False
 
         try:
             # Create default subject if not provided
             if subject is None:
-                today = datetime.now().strftime("%Y-%m-%d")
-                subject = f"AI News Digest - {today}"
+                subject = default_title()
+
+            # Build the message once; only the recipient differs per send
+            params = self._build_message(content, subject, include_html=include_html)
+            resend = self._resend()
+
+            logger.info(f"Sending email via Resend to {', '.join(self.email_to)}")
+
+            if len(self.email_to) == 1:
+                return self._send_one(resend, self.email_to[0], params)
+
+            # One batch request per _BATCH_SIZE recipients instead of one request each
+            results = [
+                self._send_batch(resend, self.email_to[i:i + _BATCH_SIZE], params)
+                for i in range(0, len(self.email_to), _BATCH_SIZE)
+            ]
+            return all(results)
+
+        except Exception as e:
+            logger.error(f"Failed to send email via Resend: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            return False
+
+    def _build_message(self, content: str, subject: str, include_html: bool = True) -> Dict[str, Any]:
+        """
+        Build the Resend message parameters, without recipients.
+
+        Args:
+            content: Email body content (news digest)
+            subject: Email subject
+            include_html: Render and include the HTML version
+
+        Returns:
+            Resend send parameters
+        """
+        params = {
+            "from": self.email_from,
+            "subject": subject,
+            "text": content,  # Plain text fallback
+        }
+        if include_html:
+            params["html"] = self._create_html_email(content, subject)
+        return params
+
+    def _resend(self) -> Any:
+        """
+        Import and configure the Resend SDK on first use.
+
+        The import is deferred so that webhook-only runs never load it.
+
+        Returns:
+            The resend module, with the API key and keep-alive HTTP client set
+        """
+        import resend
+
+        # Set the Resend API key and reuse connections across sends
+        resend.api_key = self.resend_api_key
+        resend.default_http_client = _HTTP_CLIENT
+        return resend
+
+    def _send_one(self, resend: Any, recipient: str, params: Dict[str, Any]) -> bool:
+        """
+        Send the email to a single recipient.
+
+        Args:
+            resend: Configured resend module from _resend
+            recipient: Recipient email address
+            params: Message parameters from _build_message
 
-            # Create HTML email content
-            html_content = self._create_html_email(content, subject)
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        try:
+            # Send email using Resend; the key is shared by this send's retries only
+            options = {"idempotency_key": str(uuid.uuid4())}
+            response = _send_with_retry(
+                lambda: resend.Emails.send({**params, "to": [recipient]}, options),
+                self._bucket
+            )
 
-            logger.info(f"Sending email via Resend to {self.email_to}")
+            logger.info(f"Email sent successfully via Resend to {recipient} (ID: {response.get('id', 'N/A')})")
+            return True
 
-            # Send email using Resend
-            params = {
-                "from": self.email_from,
-                "to": [self.email_to],
-                "subject": subject,
-                "html": html_content,
-                "text": content,  # Plain text fallback
-            }
+        except Exception as e:
+            logger.error(f"Failed to send email via Resend to {recipient}: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            return False
 
-            response = resend.Emails.send(params)
+    def _send_batch(self, resend: Any, recipients: List[str], params: Dict[str, Any]) -> bool:
+        """
+        Send the email to several recipients with one Resend batch request.
 
-            logger.info(f"Email sent successfully via Resend (ID: {response.get('id', 'N/A')})")
+        Each recipient still gets an individual email, so addresses are not
+        disclosed to other recipients.
+
+        Args:
+            resend: Configured resend module from _resend
+            recipients: Recipient email addresses, at most _BATCH_SIZE
+            params: Message parameters from _build_message
+
+        Returns:
+            True if the batch was accepted, False otherwise
+        """
+        try:
+            batch = [{**params, "to": [recipient]} for recipient in recipients]
+            options = {"idempotency_key": str(uuid.uuid4())}
+            response = _send_with_retry(lambda: resend.Batch.send(batch, options), self._bucket)
+
+            ids = [email.get("id", "N/A") for email in response.get("data", [])]
+            logger.info(f"Email batch sent successfully via Resend to {len(recipients)} recipients (IDs: {', '.join(ids)})")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send email via Resend: {str(e)}", exc_info=True)
+            logger.error(f"Failed to send email batch via Resend to {', '.join(recipients)}: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return False
 
+    @staticmethod
+    def _read_rate_limit() -> float:
+        """
+        Read the Resend request rate from RESEND_RATE_LIMIT.
+
+        Returns:
+            Requests per second, or the default if unset or invalid
+        """
+        value = os.getenv("RESEND_RATE_LIMIT")
+        if not value:
+            return _DEFAULT_RATE_LIMIT
+        try:
+            rate = float(value)
+        except ValueError:
+            rate = 0.0
+        if rate <= 0:
+            logger.warning(f"Invalid RESEND_RATE_LIMIT '{value}', using {_DEFAULT_RATE_LIMIT}")
+            return _DEFAULT_RATE_LIMIT
+        return rate
+
+    @staticmethod
+    def _parse_recipients(email_to: Optional[Union[str, List[str]]]) -> List[str]:
+        """
+        Normalize recipients to a list of addresses.
+
+        Args:
+            email_to: List of addresses or comma-separated string
+
+        Returns:
+            List of non-empty, stripped addresses
+        """
+        if not email_to:
+            return []
+        if isinstance(email_to, str):
+            email_to = email_to.split(",")
+        return [address.strip() for address in email_to if address.strip()]
+
+    def close(self) -> None:
+        """Close pooled connections to the Resend API"""
+        _HTTP_CLIENT.close()
+
     def _create_html_email(self, content: str, subject: str) -> str:
         """
         Create HTML version of email with proper formatting.
@@ -104,195 +723,4 @@ class EmailNotifier:
         Returns:
             HTML formatted email
         """
-        try:
-            import markdown
-            from markdown.extensions import nl2br, tables, fenced_code
-
-            # Convert markdown to HTML with extensions
-            html_content = markdown.markdown(
-                content,
-                extensions=[
-                    'nl2br',      # Convert newlines to <br>
-                    'tables',     # Support for tables
-                    'fenced_code',# Support for code blocks
-                    'sane_lists', # Better list handling
-                ]
-            )
-        except ImportError:
-            logger.warning("markdown library not installed, using basic HTML formatting")
-            # Fallback to basic HTML escaping and line break conversion
-            import html
-            html_content = html.escape(content).replace('\n', '<br>\n')
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'PingFang SC', 'Microsoft YaHei', Helvetica, Arial, sans-serif;
-                    line-height: 1.8;
-                    color: #24292e;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f6f8fa;
-                }}
-                .container {{
-                    background-color: #ffffff;
-                    border-radius: 8px;
-                    padding: 40px;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                }}
-                .title {{
-                    color: #0366d6;
-                    font-size: 32px;
-                    font-weight: 700;
-                    margin-bottom: 20px;
-                    padding-bottom: 15px;
-                    border-bottom: 4px solid #0366d6;
-                    text-align: center;
-                }}
-                .content {{
-                    margin-top: 30px;
-                }}
-                .content h1 {{
-                    color: #0366d6;
-                    font-size: 28px;
-                    font-weight: 700;
-                    margin-top: 40px;
-                    margin-bottom: 20px;
-                    padding-bottom: 12px;
-                    border-bottom: 3px solid #0366d6;
-                }}
-                .content h2 {{
-                    color: #2c3e50;
-                    font-size: 22px;
-                    font-weight: 600;
-                    margin-top: 35px;
-                    margin-bottom: 18px;
-                    padding-bottom: 10px;
-                    border-bottom: 2px solid #e1e4e8;
-                }}
-                .content h3 {{
-                    color: #24292e;
-                    font-size: 18px;
-                    font-weight: 600;
-                    margin-top: 28px;
-                    margin-bottom: 15px;
-                    padding-left: 12px;
-                    border-left: 4px solid #0366d6;
-                }}
-                .content h4 {{
-                    color: #586069;
-                    font-size: 16px;
-                    font-weight: 600;
-                    margin-top: 20px;
-                    margin-bottom: 12px;
-                }}
-                .content p {{
-                    margin: 15px 0;
-                    line-height: 1.8;
-                    color: #24292e;
-                }}
-                .content ul, .content ol {{
-                    margin: 15px 0;
-                    padding-left: 30px;
-                }}
-                .content li {{
-                    margin: 10px 0;
-                    line-height: 1.8;
-                }}
-                .content strong {{
-                    font-weight: 600;
-                    color: #0366d6;
-                }}
-                .content em {{
-                    font-style: italic;
-                    color: #586069;
-                }}
-                .content code {{
-                    background-color: #f6f8fa;
-                    padding: 3px 6px;
-                    border-radius: 3px;
-                    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-                    font-size: 0.9em;
-                    color: #d73a49;
-                }}
-                .content pre {{
-                    background-color: #f6f8fa;
-                    padding: 16px;
-                    border-radius: 6px;
-                    overflow-x: auto;
-                    border: 1px solid #e1e4e8;
-                }}
-                .content pre code {{
-                    background-color: transparent;
-                    padding: 0;
-                    color: #24292e;
-                }}
-                .content blockquote {{
-                    margin: 20px 0;
-                    padding: 10px 20px;
-                    border-left: 4px solid #dfe2e5;
-                    background-color: #f6f8fa;
-                    color: #586069;
-                }}
-                .content hr {{
-                    border: none;
-                    border-top: 2px solid #e1e4e8;
-                    margin: 30px 0;
-                }}
-                .content a {{
-                    color: #0366d6;
-                    text-decoration: none;
-                    border-bottom: 1px solid transparent;
-                    transition: border-bottom 0.2s;
-                }}
-                .content a:hover {{
-                    border-bottom: 1px solid #0366d6;
-                }}
-                .content table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 20px 0;
-                }}
-                .content th, .content td {{
-                    border: 1px solid #e1e4e8;
-                    padding: 10px 15px;
-                    text-align: left;
-                }}
-                .content th {{
-                    background-color: #f6f8fa;
-                    font-weight: 600;
-                }}
-                .footer {{
-                    margin-top: 50px;
-                    padding-top: 25px;
-                    border-top: 2px solid #e1e4e8;
-                    text-align: center;
-                    font-size: 14px;
-                    color: #586069;
-                }}
-                .footer p {{
-                    margin: 8px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="title">{subject}</div>
-                <div class="content">
-                    {html_content}
-                </div>
-            </div>
-            <div class="footer">
-                <p>This email was automatically generated by AI News Bot</p>
-                <p>Powered by Anthropic Claude</p>
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        return _render_html(content, subject)
@@ -0,0 +1,23 @@
+"""
+Helpers shared by the notifiers
+"""
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2)
+def _date_str(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as YYYY-MM-DD"""
+    return date.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+
+def default_title() -> str:
+    """
+    Get the default notification subject/title for today.
+
+    The date string is formatted once per calendar day.
+
+    Returns:
+        Title such as 'AI News Digest - 2025-01-31'
+    """
+    return f"AI News Digest - {_date_str(date.today().toordinal())}"
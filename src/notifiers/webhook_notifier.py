@@ -1,16 +1,72 @@
 """
 Webhook notification module
 """
+import asyncio
+import json
+import logging
 import os
+import random
+import time
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime
 from ..logger import setup_logger
+from .utils import default_title
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON encoder
+    orjson = None
 
 
 logger = setup_logger(__name__)
 
 
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a payload to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        payload: JSON-serializable payload
+
+    Returns:
+        Encoded request body
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Webhook retry policy: retries after the first attempt, statuses worth
+# retrying, and the backoff base and cap in seconds
+_RETRY_TOTAL = 3
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRY_BACKOFF_FACTOR = 1.0
+_RETRY_MAX_BACKOFF = 30.0
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry that spreads backoff delays with random jitter and caps every wait"""
+
+    def get_backoff_time(self) -> float:
+        """Exponential backoff plus up to 50% jitter, capped at _RETRY_MAX_BACKOFF"""
+        base = super().get_backoff_time()
+        return min(_RETRY_MAX_BACKOFF, base + random.uniform(0, 0.5 * base))
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """Server-requested Retry-After delay, capped at _RETRY_MAX_BACKOFF"""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(_RETRY_MAX_BACKOFF, retry_after)
+
+
 class WebhookNotifier:
     """Send webhook notifications with AI news digest"""
 
@@ -23,16 +79,37 @@ class WebhookNotifier:
         Initialize WebhookNotifier.
 
         Args:
-            webhook_url: Webhook URL to send notifications to
+            webhook_url: Webhook URL to send notifications to, or several
+                comma-separated URLs
             timeout: Request timeout in seconds
         """
         self.webhook_url = webhook_url or os.getenv("WEBHOOK_URL")
+        self.webhook_urls = [url.strip() for url in (self.webhook_url or "").split(",") if url.strip()]
+        # URLs never change after init, so mask them for logging once
+        self._masked_urls = {url: self._mask_url(url) for url in self.webhook_urls}
         self.timeout = timeout
 
-        if not self.webhook_url:
+        # Keep connections alive so repeated sends skip the TCP+TLS handshake.
+        # Prefer an HTTP/2 httpx client, which multiplexes sends to one host
+        # over a single connection; fall back to a requests session
+        self._client = self._create_http2_client()
+        self._http2 = self._client is not None
+        if self._http2:
+            import httpx
+
+            self._session = None
+            self._timeout_errors = (httpx.TimeoutException,)
+            self._request_errors = (httpx.HTTPError,)
+        else:
+            self._session = self._create_session()
+            self._timeout_errors = (requests.exceptions.Timeout,)
+            self._request_errors = (requests.exceptions.RequestException,)
+
+        if not self.webhook_urls:
             logger.warning("Webhook URL not configured")
         else:
-            logger.info(f"WebhookNotifier initialized (URL: {self._mask_url(self.webhook_url)})")
+            masked = ", ".join(self._masked_urls.values())
+            logger.info(f"WebhookNotifier initialized (URL: {masked})")
 
     def send(
         self,
@@ -51,55 +128,210 @@ class WebhookNotifier:
         Returns:
             True if webhook sent successfully, False otherwise
         """
-        if not self.webhook_url:
+        if not self.webhook_urls:
             logger.error("Webhook URL is not configured. Skipping webhook send.")
             return False
 
         try:
-            # Create default title if not provided
-            if title is None:
-                today = datetime.now().strftime("%Y-%m-%d")
-                title = f"AI News Digest - {today}"
-
-            # Prepare payload
-            payload = {
-                "title": title,
-                "content": content,
-                "timestamp": datetime.now().isoformat(),
-                "source": "AI News Bot"
-            }
-
-            # Add additional data if provided
-            if additional_data:
-                payload.update(additional_data)
-
-            logger.info(f"Sending webhook to {self._mask_url(self.webhook_url)}")
+            payload = self._build_payload(content, title, additional_data)
             logger.debug(f"Payload keys: {list(payload.keys())}")
+            # Encode once; every URL gets the same body
+            body = _encode_json(payload)
+        except Exception as e:
+            logger.error(f"Unexpected error sending webhook: {str(e)}", exc_info=True)
+            return False
 
-            # Send webhook
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
-            )
+        if len(self.webhook_urls) == 1:
+            return self._post(self.webhook_urls[0], body)
+
+        # Post to every URL concurrently over the pooled client, keeping its retries
+        with ThreadPoolExecutor(max_workers=min(4, len(self.webhook_urls))) as executor:
+            results = list(executor.map(lambda url: self._post(url, body), self.webhook_urls))
+        return all(results)
+
+    async def send_async(
+        self,
+        content: str,
+        title: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Send the webhook notification without blocking the event loop.
+
+        Runs send() in a worker thread, so it can be awaited from async code.
+
+        Args:
+            content: News digest content
+            title: Title for the notification. If None, uses default with current date
+            additional_data: Additional data to include in webhook payload
+
+        Returns:
+            True if every webhook was sent successfully, False otherwise
+        """
+        return await asyncio.to_thread(self.send, content, title, additional_data)
+
+    def _post(self, url: str, body: bytes) -> bool:
+        """
+        Post the payload to one webhook URL.
+
+        Args:
+            url: Webhook URL
+            body: Encoded JSON payload
+
+        Returns:
+            True if the webhook was sent successfully, False otherwise
+        """
+        masked = self._masked_urls[url]
+        try:
+            logger.info(f"Sending webhook to {masked}")
+
+            # Send webhook; the client already sets the JSON Content-Type
+            if self._http2:
+                response = self._post_http2(url, body)
+            else:
+                response = self._session.post(url, data=body, timeout=self.timeout)
 
             # Check response
             response.raise_for_status()
 
-            logger.info(f"Webhook sent successfully (status: {response.status_code})")
+            logger.info(f"Webhook sent successfully to {masked} (status: {response.status_code})")
             return True
 
-        except requests.exceptions.Timeout:
-            logger.error(f"Webhook request timed out after {self.timeout} seconds")
+        except self._timeout_errors:
+            logger.error(f"Webhook request to {masked} timed out after {self.timeout} seconds")
             return False
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send webhook: {str(e)}", exc_info=True)
+        except self._request_errors as e:
+            logger.error(f"Failed to send webhook to {masked}: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return False
         except Exception as e:
-            logger.error(f"Unexpected error sending webhook: {str(e)}", exc_info=True)
+            logger.error(f"Unexpected error sending webhook to {masked}: {str(e)}", exc_info=True)
             return False
 
+    def _build_payload(
+        self,
+        content: str,
+        title: Optional[str],
+        additional_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build the webhook JSON payload.
+
+        Args:
+            content: News digest content
+            title: Title for the notification. If None, uses default with current date
+            additional_data: Additional data to include in webhook payload
+
+        Returns:
+            Payload dict
+        """
+        # Create default title if not provided
+        if title is None:
+            title = default_title()
+
+        payload = {
+            "title": title,
+            "content": content,
+            "timestamp": datetime.now().isoformat(),
+            "source": "AI News Bot"
+        }
+
+        # Add additional data if provided
+        if additional_data:
+            payload.update(additional_data)
+
+        return payload
+
+    def _create_http2_client(self) -> Optional["httpx.Client"]:
+        """
+        Create an HTTP/2 httpx client.
+
+        Connection failures are retried by the transport; retryable statuses
+        are handled by _post_http2.
+
+        Returns:
+            Client, or None if httpx or its HTTP/2 support (h2) is not installed
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401  (httpx[http2])
+        except ImportError:
+            return None
+
+        return httpx.Client(
+            timeout=self.timeout,
+            headers={"Content-Type": "application/json"},
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=_RETRY_TOTAL,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+            )
+        )
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP/1.1 requests session used when httpx is unavailable.
+
+        Returns:
+            Session with a JSON Content-Type header and a retrying adapter
+        """
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json"})
+        # Retry connection failures and 429/5xx responses inside the adapter.
+        # Read errors are not retried: the server may already have accepted
+        # the POST, and a retry would deliver the digest twice
+        retry = _JitteredRetry(
+            total=_RETRY_TOTAL,
+            read=0,
+            backoff_factor=_RETRY_BACKOFF_FACTOR,
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _post_http2(self, url: str, body: bytes) -> "httpx.Response":
+        """
+        Post with the HTTP/2 client, retrying 429/5xx responses with backoff.
+
+        Honors Retry-After, otherwise waits with exponential backoff plus up
+        to 50% jitter, capped at _RETRY_MAX_BACKOFF, like the requests path.
+
+        Args:
+            url: Webhook URL
+            body: Encoded JSON payload
+
+        Returns:
+            Final response
+        """
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = self._client.post(url, content=body)
+            if response.status_code not in _RETRY_STATUS or attempt == _RETRY_TOTAL:
+                return response
+
+            try:
+                delay = float(response.headers.get("retry-after", ""))
+            except ValueError:
+                base = _RETRY_BACKOFF_FACTOR * 2 ** attempt
+                delay = base + random.uniform(0, 0.5 * base)
+            delay = min(_RETRY_MAX_BACKOFF, max(0.0, delay))
+
+            logger.warning(
+                f"Webhook to {self._masked_urls.get(url, '***')} returned {response.status_code}, "
+                f"retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections"""
+        if self._client is not None:
+            self._client.close()
+        if self._session is not None:
+            self._session.close()
+
     def _mask_url(self, url: str) -> str:
         """
         Mask sensitive parts of URL for logging.
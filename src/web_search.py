@@ -1,14 +1,20 @@
 """
 Web Search Tool for fetching real-time news
 """
+import io
 import os
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Dict, Tuple
 from .logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
+# Upper bound on parallel searches issued for a single tool-use turn
+_MAX_SEARCH_WORKERS = 5
+
 
 class WebSearchTool:
     """Tool for searching the web to fetch current AI news"""
@@ -34,47 +40,83 @@ class WebSearchTool:
         try:
             logger.info(f"Searching for: {query}")
 
-            # Use DuckDuckGo instant answer API
-            params = {
-                'q': query,
-                'format': 'json',
-                'no_html': 1,
-                't': 'ai-news-bot'
-            }
-
-            response = requests.get(self.search_api_url, params=params, timeout=10)
+            response = requests.get(self.search_api_url, params=self._search_params(query), timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-            results = []
-
-            # Extract related topics if available
-            if 'RelatedTopics' in data:
-                for topic in data['RelatedTopics'][:max_results]:
-                    if isinstance(topic, dict) and 'Text' in topic:
-                        result = {
-                            'title': topic.get('FirstURL', '').split('/')[-1].replace('_', ' '),
-                            'snippet': topic.get('Text', ''),
-                            'url': topic.get('FirstURL', '')
-                        }
-                        if result['snippet']:
-                            results.append(result)
-
-            # If we have an abstract, add it as the first result
-            if data.get('Abstract'):
-                results.insert(0, {
-                    'title': data.get('Heading', query),
-                    'snippet': data['Abstract'],
-                    'url': data.get('AbstractURL', '')
-                })
-
+            results = self._parse_results(response.json(), query, max_results)
             logger.info(f"Found {len(results)} search results")
-            return results[:max_results]
+            return results
 
         except Exception as e:
             logger.error(f"Search failed: {str(e)}", exc_info=True)
             return []
 
+    def search_news_concurrently(
+        self,
+        searches: List[Tuple[str, int]]
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Run several searches in parallel threads.
+
+        Args:
+            searches: (query, max_results) pairs
+
+        Returns:
+            Search results for each pair, in the same order
+        """
+        if not searches:
+            return []
+        if len(searches) == 1:
+            return [self.search_news(*searches[0])]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_SEARCH_WORKERS, len(searches))) as executor:
+            return list(executor.map(lambda search: self.search_news(*search), searches))
+
+    def _search_params(self, query: str) -> Dict[str, Any]:
+        """Build DuckDuckGo instant answer API query parameters"""
+        return {
+            'q': query,
+            'format': 'json',
+            'no_html': 1,
+            't': 'ai-news-bot'
+        }
+
+    def _parse_results(self, data: Dict[str, Any], query: str, max_results: int) -> List[Dict[str, str]]:
+        """
+        Extract search results from a DuckDuckGo instant answer response.
+
+        Args:
+            data: Decoded JSON response
+            query: Search query string (used as fallback heading)
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of search results with title, snippet, and url
+        """
+        results = []
+
+        # Extract related topics if available
+        if 'RelatedTopics' in data:
+            for topic in data['RelatedTopics'][:max_results]:
+                if isinstance(topic, dict) and 'Text' in topic:
+                    result = {
+                        'title': topic.get('FirstURL', '').split('/')[-1].replace('_', ' '),
+                        'snippet': topic.get('Text', ''),
+                        'url': topic.get('FirstURL', '')
+                    }
+                    if result['snippet']:
+                        results.append(result)
+
+        # If we have an abstract, add it as the first result
+        if data.get('Abstract'):
+            results.insert(0, {
+                'title': data.get('Heading', query),
+                'snippet': data['Abstract'],
+                'url': data.get('AbstractURL', '')
+            })
+
+        return results[:max_results]
+
     def search_ai_news(self, max_results: int = 15) -> str:
         """
         Search for recent AI news and format results.
@@ -105,21 +147,25 @@ class WebSearchTool:
             return "No recent news found via web search."
 
         # Format results
-        formatted = "Recent AI News from Web Search:\n\n"
+        buf = io.StringIO()
+        buf.write("Recent AI News from Web Search:\n\n")
         for i, result in enumerate(all_results[:max_results], 1):
-            formatted += f"{i}. {result['title']}\n"
-            formatted += f"   {result['snippet']}\n"
+            buf.write(f"{i}. {result['title']}\n")
+            buf.write(f"   {result['snippet']}\n")
             if result['url']:
-                formatted += f"   Source: {result['url']}\n"
-            formatted += "\n"
+                buf.write(f"   Source: {result['url']}\n")
+            buf.write("\n")
 
-        return formatted
+        return buf.getvalue()
 
 
+@lru_cache(maxsize=1)
 def get_search_tool_definition() -> Dict:
     """
     Get the tool definition for Claude API tool calling.
 
+    The definition is built once and shared; callers must not mutate it.
+
     Returns:
         Tool definition dict for Anthropic API
     """
@@ -0,0 +1,116 @@
+"""
+Tests for configuration loading
+"""
+import os
+
+import pytest
+import yaml
+
+from src import config as config_module
+from src.config import Config
+
+
+@pytest.fixture(autouse=True)
+def clear_yaml_cache(monkeypatch):
+    monkeypatch.setattr(config_module, "_YAML_CACHE", config_module.OrderedDict())
+
+
+@pytest.fixture
+def yaml_loads(monkeypatch):
+    """Count YAML parses"""
+    calls = []
+    real_load = yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+    return calls
+
+
+def write_config(path, level):
+    path.write_text(f"logging:\n  level: {level}\n", encoding="utf-8")
+
+
+def test_yaml_is_parsed_once_while_unchanged(tmp_path, yaml_loads):
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+
+    assert Config(str(path)).log_level == "INFO"
+    assert Config(str(path)).log_level == "INFO"
+    assert len(yaml_loads) == 1
+
+
+def test_yaml_is_reparsed_when_modified(tmp_path, yaml_loads):
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    Config(str(path))
+
+    write_config(path, "WARN")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert Config(str(path)).log_level == "WARN"
+    assert len(yaml_loads) == 2
+
+
+def test_cached_config_is_not_shared(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+
+    Config(str(path)).config_data["logging"]["level"] = "DEBUG"
+    assert Config(str(path)).log_level == "INFO"
+
+
+def test_json_sidecar_is_written_and_preferred(tmp_path, monkeypatch, yaml_loads):
+    monkeypatch.setenv("CONFIG_CACHE", "1")
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    sidecar = tmp_path / "config.yaml.cache.json"
+
+    Config(str(path))
+    assert sidecar.exists()
+
+    # A new process starts with an empty in-memory cache
+    monkeypatch.setattr(config_module, "_YAML_CACHE", config_module.OrderedDict())
+    assert Config(str(path)).log_level == "INFO"
+    assert len(yaml_loads) == 1
+
+
+def test_stale_json_sidecar_is_ignored(tmp_path, monkeypatch, yaml_loads):
+    monkeypatch.setenv("CONFIG_CACHE", "1")
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    Config(str(path))
+
+    write_config(path, "WARN")
+    sidecar = tmp_path / "config.yaml.cache.json"
+    st = path.stat()
+    os.utime(sidecar, ns=(st.st_atime_ns, st.st_mtime_ns - 1_000_000_000))
+
+    assert Config(str(path)).log_level == "WARN"
+    assert len(yaml_loads) == 2
+
+
+def test_json_sidecar_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("CONFIG_CACHE", raising=False)
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+
+    Config(str(path))
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+@pytest.mark.parametrize("level, expected", [("DEBUG", 10), ("info", 20), ("WARN", 30), ("CRITICAL", 50)])
+def test_log_level_int(tmp_path, level, expected):
+    path = tmp_path / "config.yaml"
+    write_config(path, level)
+    assert Config(str(path)).log_level_int == expected
+
+
+def test_unknown_log_level_is_rejected(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, "LOUD")
+    with pytest.raises(ValueError, match="Invalid logging.level 'LOUD'"):
+        Config(str(path)).log_level_int
@@ -0,0 +1,195 @@
+"""
+Tests for the email notifier
+"""
+import json
+
+import pytest
+import resend
+
+from src.notifiers import email_notifier
+from src.notifiers.email_notifier import EmailNotifier, _is_retryable, _render_markdown_basic, _retry_delay
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class FakeHTTPClient:
+    """Stand-in for the Resend HTTP client that replays canned responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers, json=None, files=None, data=None):
+        self.requests.append({"url": url, "headers": dict(headers), "json": json})
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def ok(body=None):
+    return json.dumps(body or {"id": "email-id"}).encode(), 200, JSON_HEADERS
+
+
+def error(status, name="application_error", headers=None):
+    body = {"statusCode": status, "name": name, "message": "failed"}
+    return json.dumps(body).encode(), status, {**JSON_HEADERS, **(headers or {})}
+
+
+@pytest.fixture
+def http_client(monkeypatch):
+    client = FakeHTTPClient([])
+    monkeypatch.setattr(email_notifier, "_HTTP_CLIENT", client)
+    monkeypatch.setattr(email_notifier.time, "sleep", lambda seconds: None)
+    monkeypatch.setenv("RESEND_RATE_LIMIT", "1000")
+    return client
+
+
+def test_headers_and_horizontal_rule():
+    assert _render_markdown_basic("# Title\n---\n### Section") == \
+        "<h1>Title</h1>\n<hr>\n<h3>Section</h3>"
+
+
+def test_bullet_list_with_continuation():
+    html = _render_markdown_basic("- one\n- **two**\n  more")
+    assert html == "<ul>\n<li>one</li>\n<li><strong>two</strong><br>more</li>\n</ul>\n"
+
+
+def test_numbered_list_and_italic():
+    html = _render_markdown_basic("1. first\n2. *second*")
+    assert html == "<ol>\n<li>first</li>\n<li><em>second</em></li>\n</ol>\n"
+
+
+def test_plain_lines_are_escaped_and_broken():
+    assert _render_markdown_basic("a & <b>\nnext") == "a &amp; &lt;b&gt;<br>\nnext<br>"
+
+
+def test_link():
+    assert _render_markdown_basic("See [site](https://example.com/a?b=1&c=2)") == \
+        'See <a href="https://example.com/a?b=1&amp;c=2">site</a><br>'
+
+
+def test_link_with_quote_cannot_inject_attributes():
+    assert _render_markdown_basic('[x](https://a"onmouseover="alert(1))') == \
+        '[x](https://a"onmouseover="alert(1))<br>'
+
+
+def _error(code, error_type="application_error", headers=None):
+    return resend.exceptions.ResendError(code, error_type, "failed", "", headers)
+
+
+def test_is_retryable():
+    assert _is_retryable(_error(429, "rate_limit_exceeded"))
+    assert _is_retryable(_error(500))
+    assert _is_retryable(_error("503"))
+    assert not _is_retryable(_error(422, "validation_error"))
+    assert not _is_retryable(_error(429, "daily_quota_exceeded"))
+    assert not _is_retryable(_error(None))
+    assert not _is_retryable(ValueError("boom"))
+
+
+def test_retry_delay_honors_retry_after_in_any_case():
+    assert _retry_delay(_error(429, headers={"Retry-After": "7"}), 0) == 7.0
+    assert _retry_delay(_error(429, headers={"retry-after": "3"}), 0) == 3.0
+    assert _retry_delay(_error(429, headers={"retry-after": "3600"}), 0) == 30.0
+
+
+def test_send_retries_transient_errors_with_one_idempotency_key(http_client):
+    http_client.responses = [error(503), error(429, "rate_limit_exceeded"), ok()]
+
+    assert EmailNotifier("re_test", "bot@example.com", "reader@example.com").send("# hi")
+    keys = {request["headers"]["Idempotency-Key"] for request in http_client.requests}
+    assert len(http_client.requests) == 3
+    assert len(keys) == 1
+
+
+def test_separate_sends_use_separate_idempotency_keys(http_client):
+    http_client.responses = [ok(), ok()]
+    notifier = EmailNotifier("re_test", "bot@example.com", "reader@example.com")
+
+    assert notifier.send("# hi", subject="Digest")
+    assert notifier.send("# hi", subject="Digest")
+    first, second = (request["headers"]["Idempotency-Key"] for request in http_client.requests)
+    assert first != second
+
+
+def test_send_does_not_retry_client_errors(http_client):
+    http_client.responses = [error(422, "validation_error")]
+
+    assert not EmailNotifier("re_test", "bot@example.com", "reader@example.com").send("# hi")
+    assert len(http_client.requests) == 1
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that sleep advances"""
+    now = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(email_notifier.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(email_notifier.time, "sleep", sleep)
+    return now, sleeps
+
+
+def test_token_bucket_allows_burst_then_holds_rate(clock):
+    _, sleeps = clock
+    bucket = email_notifier._TokenBucket(rate=2.0, capacity=2.0)
+
+    for _ in range(5):
+        bucket.acquire()
+    assert sleeps == [0.5, 0.5, 0.5]
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    now, sleeps = clock
+    bucket = email_notifier._TokenBucket(rate=2.0, capacity=2.0)
+    bucket.acquire()
+    bucket.acquire()
+
+    now[0] += 60
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+    bucket.acquire()
+    assert sleeps == [0.5]
+
+
+@pytest.mark.parametrize("value, expected", [(None, 2.0), ("5", 5.0), ("0.5", 0.5), ("0", 2.0), ("fast", 2.0)])
+def test_read_rate_limit(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("RESEND_RATE_LIMIT", raising=False)
+    else:
+        monkeypatch.setenv("RESEND_RATE_LIMIT", value)
+    assert EmailNotifier._read_rate_limit() == expected
+
+
+def test_many_recipients_are_sent_in_batches(http_client):
+    recipients = [f"reader{i}@example.com" for i in range(250)]
+    http_client.responses = [ok({"data": [{"id": "email-id"}]}) for _ in range(3)]
+
+    assert EmailNotifier("re_test", "bot@example.com", recipients).send("# hi")
+    assert [request["url"].rsplit("/", 1)[-1] for request in http_client.requests] == ["batch"] * 3
+    batches = [request["json"] for request in http_client.requests]
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert [email["to"] for batch in batches for email in batch] == [[recipient] for recipient in recipients]
+    assert len({request["headers"]["Idempotency-Key"] for request in http_client.requests}) == 3
+
+
+def test_failed_batch_fails_the_send(http_client):
+    recipients = [f"reader{i}@example.com" for i in range(150)]
+    http_client.responses = [ok({"data": []}), error(422, "validation_error")]
+
+    assert not EmailNotifier("re_test", "bot@example.com", recipients).send("# hi")
+    assert len(http_client.requests) == 2
+
+
+def test_single_recipient_uses_the_emails_endpoint(http_client):
+    http_client.responses = [ok()]
+
+    assert EmailNotifier("re_test", "bot@example.com", "reader@example.com").send("# hi")
+    assert http_client.requests[0]["url"].endswith("/emails")
+    assert http_client.requests[0]["json"]["to"] == ["reader@example.com"]
@@ -0,0 +1,98 @@
+"""
+Tests for the LLM response caches
+"""
+import json
+
+import pytest
+
+from src import llm_cache
+from src.llm_cache import LLMCache, SemanticLLMCache
+
+
+def test_make_key_is_deterministic():
+    assert LLMCache.make_key("model", "prompt", {"a": 1, "b": 2}) == \
+        LLMCache.make_key("model", "prompt", {"b": 2, "a": 1})
+
+
+def test_make_key_depends_on_parts_and_order():
+    key = LLMCache.make_key("model", "prompt")
+    assert key != LLMCache.make_key("model", "other prompt")
+    assert key != LLMCache.make_key("prompt", "model")
+    assert len(key) == 64
+
+
+def test_get_missing_key_returns_none(tmp_path):
+    assert LLMCache(tmp_path).get(LLMCache.make_key("missing")) is None
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = LLMCache(tmp_path / "nested")
+    key = LLMCache.make_key("model", "prompt")
+    cache.set(key, "digest — ünïcode", ttl=60)
+
+    assert cache.get(key) == "digest — ünïcode"
+    # The write goes through a temp file that is renamed into place
+    assert [p.name for p in (tmp_path / "nested").iterdir()] == [f"{key}.json"]
+
+
+def test_entry_expires_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    cache = LLMCache(tmp_path)
+    key = LLMCache.make_key("model", "prompt")
+    cache.set(key, "digest", ttl=60)
+
+    now[0] += 60
+    assert cache.get(key) == "digest"
+    now[0] += 1
+    assert cache.get(key) is None
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path):
+    cache = LLMCache(tmp_path)
+    key = LLMCache.make_key("model", "prompt")
+    (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+    assert cache.get(key) is None
+
+    (tmp_path / f"{key}.json").write_text(json.dumps({"value": "x"}), encoding="utf-8")
+    assert cache.get(key) is None
+
+
+@pytest.fixture
+def semantic_cache(tmp_path):
+    cache = SemanticLLMCache(tmp_path / "semantic.npz", threshold=0.92, ttl=60)
+    if not cache.enabled:
+        pytest.skip("numpy not installed")
+    return cache
+
+
+def test_semantic_hit_on_near_duplicate_topics(semantic_cache):
+    semantic_cache.set("scope", "Large language model research", "digest")
+    assert semantic_cache.get("scope", "Large language models research") == "digest"
+
+
+def test_semantic_miss_on_unrelated_topics(semantic_cache):
+    semantic_cache.set("scope", "Large language model research", "digest")
+    assert semantic_cache.get("scope", "Semiconductor export controls") is None
+
+
+def test_semantic_miss_on_other_scope(semantic_cache):
+    semantic_cache.set("scope", "Large language model research", "digest")
+    assert semantic_cache.get("other scope", "Large language model research") is None
+
+
+def test_semantic_entries_persist(semantic_cache, tmp_path):
+    semantic_cache.set("scope", "Large language model research", "digest")
+    reloaded = SemanticLLMCache(tmp_path / "semantic.npz", ttl=60)
+    assert reloaded.get("scope", "Large language model research") == "digest"
+
+
+def test_semantic_entry_expires_after_ttl(semantic_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    semantic_cache.set("scope", "Large language model research", "digest")
+
+    now[0] += 60
+    assert semantic_cache.get("scope", "Large language model research") == "digest"
+    now[0] += 1
+    assert semantic_cache.get("scope", "Large language model research") is None
@@ -0,0 +1,423 @@
+"""
+Tests for NewsGenerator request handling, retries and caching
+"""
+import contextlib
+import copy
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import anthropic
+import pytest
+
+from src import news_generator
+from src.llm_cache import LLMCache, SemanticLLMCache
+from src.news_generator import NewsGenerator
+
+
+# Long enough that the boilerplate would dominate a whole-prompt similarity
+TEMPLATE = """You are an AI news curator. Please provide a concise daily digest of AI news and developments.
+
+Focus on these topics:
+{topics}
+
+Requirements:
+1. Provide 3-5 key news items or developments
+2. Each item should include a brief description (2-3 sentences)
+3. Focus on significant developments from the past 24-48 hours
+4. Include context about why each item is important
+5. Use a professional but accessible tone
+
+Format your response as a structured news digest with clear sections."""
+
+
+class FakeMessages:
+    """Stand-in for client.messages that returns a numbered digest per call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        text = f"digest {len(self.calls)}"
+        return SimpleNamespace(stop_reason="end_turn", content=[SimpleNamespace(type="text", text=text)])
+
+
+class ScriptedMessages:
+    """Stand-in for client.messages that replays canned responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.streamed = []
+
+    def create(self, **kwargs):
+        self.requests.append(copy.deepcopy(kwargs["messages"]))
+        self.streamed.append(False)
+        return self.responses.pop(0)
+
+    @contextlib.contextmanager
+    def stream(self, **kwargs):
+        message = self.create(**kwargs)
+        self.streamed[-1] = True
+        yield SimpleNamespace(text_stream=iter(()), get_final_message=lambda: message)
+
+
+class FakeSearchTool:
+    """Stand-in for WebSearchTool that records the queries it runs"""
+
+    def __init__(self, results=None):
+        self.results = results if results is not None else [{"title": "T", "snippet": "S", "url": "https://x"}]
+        self.queries = []
+
+    def search_news_concurrently(self, searches):
+        self.queries.extend(query for query, _ in searches)
+        return [self.results for _ in searches]
+
+
+def tool_use_turn(*queries):
+    blocks = [
+        SimpleNamespace(type="tool_use", id=f"tool-{query}-{i}", name="web_search", input={"query": query})
+        for i, query in enumerate(queries)
+    ]
+    return SimpleNamespace(stop_reason="tool_use", content=blocks)
+
+
+def end_turn(text="digest"):
+    return SimpleNamespace(stop_reason="end_turn", content=[SimpleNamespace(type="text", text=text)])
+
+
+@pytest.fixture
+def generator(tmp_path):
+    gen = NewsGenerator(api_key="test-key")
+    gen.client = SimpleNamespace(messages=FakeMessages())
+    gen.llm_cache = LLMCache(tmp_path / "llm_cache")
+    return gen
+
+
+@pytest.fixture
+def semantic_generator(generator, tmp_path):
+    generator.semantic_cache = SemanticLLMCache(tmp_path / "semantic.npz")
+    if not generator.semantic_cache.enabled:
+        pytest.skip("numpy not installed")
+    return generator
+
+
+def test_semantic_cache_hit_on_near_duplicate_topics(semantic_generator):
+    gen = semantic_generator
+    first = gen.generate_news_digest(["Large language model research"], TEMPLATE, cache_enabled=True)
+    second = gen.generate_news_digest(["Large language models research"], TEMPLATE, cache_enabled=True)
+    assert first == second == "digest 1"
+
+
+def test_semantic_cache_miss_on_unrelated_topics(semantic_generator):
+    semantic_generator.generate_news_digest(["Large language model research"], TEMPLATE, cache_enabled=True)
+    assert semantic_generator.generate_news_digest(
+        ["Semiconductor export controls"], TEMPLATE, cache_enabled=True
+    ) == "digest 2"
+
+
+def test_semantic_cache_is_scoped_to_the_day(semantic_generator, monkeypatch):
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.fromordinal(date.today().toordinal() + 1)
+
+    semantic_generator.generate_news_digest(["Large language model research"], TEMPLATE, cache_enabled=True)
+    semantic_generator.llm_cache = LLMCache(semantic_generator.llm_cache.cache_dir / "empty")
+    monkeypatch.setattr(news_generator, "date", Tomorrow)
+    assert semantic_generator.generate_news_digest(
+        ["Large language model research"], TEMPLATE, cache_enabled=True
+    ) == "digest 2"
+
+
+def test_semantic_cache_is_scoped_to_the_template(semantic_generator):
+    semantic_generator.generate_news_digest(["Large language model research"], TEMPLATE, cache_enabled=True)
+    assert semantic_generator.generate_news_digest(
+        ["Large language models research"], "Summarize:\n{topics}", cache_enabled=True
+    ) == "digest 2"
+
+
+def test_semantic_cache_not_used_with_web_search(semantic_generator):
+    semantic_generator.enable_web_search = True
+    semantic_generator.generate_news_digest(["Large language model research"], TEMPLATE, cache_enabled=True)
+    assert semantic_generator.generate_news_digest(
+        ["Large language models research"], TEMPLATE, cache_enabled=True
+    ) == "digest 2"
+
+
+def _status_error(status, headers=None):
+    response = SimpleNamespace(status_code=status, headers=headers or {}, request=None)
+    return anthropic.APIStatusError("failed", response=response, body=None)
+
+
+@pytest.mark.parametrize("status", [408, 429, 500, 502, 503, 504, 529])
+def test_transient_status_is_retryable(status):
+    assert news_generator._is_retryable(_status_error(status))
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 413, 422])
+def test_client_error_is_not_retryable(status):
+    assert not news_generator._is_retryable(_status_error(status))
+
+
+def test_other_exceptions_are_not_retryable():
+    assert not news_generator._is_retryable(ValueError("boom"))
+
+
+def test_connection_and_overload_errors_are_retryable():
+    assert news_generator._is_retryable(anthropic.APIConnectionError(request=None))
+    assert news_generator._is_retryable(anthropic.APITimeoutError(request=None))
+    response = SimpleNamespace(status_code=429, headers={}, request=None)
+    assert news_generator._is_retryable(anthropic.RateLimitError("slow down", response=response, body=None))
+
+
+def test_retry_after_ms_takes_precedence():
+    assert news_generator._retry_after({"retry-after-ms": "1500", "retry-after": "9"}) == 1.5
+
+
+def test_retry_after_seconds():
+    assert news_generator._retry_after({"retry-after": "12"}) == 12.0
+
+
+def test_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=20)
+    delay = news_generator._retry_after({"retry-after": format_datetime(when, usegmt=True)})
+    assert 18 <= delay <= 20
+
+
+def test_retry_after_missing_or_invalid():
+    assert news_generator._retry_after({}) is None
+    assert news_generator._retry_after({"retry-after": "soon"}) is None
+    assert news_generator._retry_after({"retry-after-ms": "x", "retry-after": "2"}) == 2.0
+
+
+def test_retry_delay_honors_server_request_within_cap():
+    assert news_generator._retry_delay(_status_error(429, {"retry-after": "3"}), 0) == 3.0
+    assert news_generator._retry_delay(_status_error(429, {"retry-after": "600"}), 0) == 30.0
+    assert news_generator._retry_delay(_status_error(429, {"retry-after": "-5"}), 0) == 0.0
+
+
+def test_retry_delay_backoff_is_jittered_and_bounded(monkeypatch):
+    monkeypatch.setattr(news_generator.random, "uniform", lambda low, high: high)
+    assert [news_generator._retry_delay(_status_error(503), attempt) for attempt in range(7)] == \
+        [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+    monkeypatch.setattr(news_generator.random, "uniform", lambda low, high: low)
+    assert news_generator._retry_delay(_status_error(503), 3) == 0.0
+
+
+def test_generate_with_retry_retries_transient_errors(generator, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(news_generator.time, "sleep", sleeps.append)
+    outcomes = [_status_error(529), _status_error(503), "digest"]
+
+    def generate(*args, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(generator, "generate_news_digest", generate)
+    assert generator.generate_with_retry(["AI"], TEMPLATE) == "digest"
+    assert len(sleeps) == 2
+
+
+def test_generate_with_retry_gives_up_after_max_retries(generator, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(news_generator.time, "sleep", sleeps.append)
+    error = _status_error(503)
+
+    def generate(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(generator, "generate_news_digest", generate)
+    with pytest.raises(anthropic.APIStatusError) as excinfo:
+        generator.generate_with_retry(["AI"], TEMPLATE, max_retries=3)
+    assert excinfo.value is error
+    assert len(sleeps) == 2
+
+
+def test_generate_with_retry_does_not_retry_client_errors(generator, monkeypatch):
+    calls = []
+
+    def generate(*args, **kwargs):
+        calls.append(args)
+        raise _status_error(400)
+
+    monkeypatch.setattr(generator, "generate_news_digest", generate)
+    with pytest.raises(anthropic.APIStatusError):
+        generator.generate_with_retry(["AI"], TEMPLATE)
+    assert len(calls) == 1
+
+
+def test_build_prompt_formats_topics_as_bullets():
+    assert news_generator._build_prompt(("LLMs", "Robotics"), "Topics:\n{topics}\nEnd") == \
+        "Topics:\n- LLMs\n- Robotics\nEnd"
+
+
+def test_build_prompt_is_memoized():
+    first = news_generator._build_prompt(("LLMs", "Robotics"), TEMPLATE)
+    assert news_generator._build_prompt(("LLMs", "Robotics"), TEMPLATE) is first
+
+
+@pytest.mark.parametrize("template, expected", [
+    ("Before {topics} after", ("Before ", " after")),
+    ("{topics}", ("", "")),
+    ("No placeholder", None),
+    ("{topics} for {date}", None),
+    ("Use {{braces}} with {topics}", None),
+])
+def test_split_template(template, expected):
+    assert news_generator._split_template(template) == expected
+
+
+def test_build_prompt_splices_split_template_without_formatting():
+    # Splicing must not interpret braces inside the topics themselves
+    assert news_generator._build_prompt(("Sets like {a, b}",), "Focus on:\n{topics}") == \
+        "Focus on:\n- Sets like {a, b}"
+
+
+def test_build_prompt_leaves_unknown_placeholders_empty():
+    assert news_generator._build_prompt(("LLMs",), "Date: {date}\n{topics}\n{{literal}}") == \
+        "Date: \n- LLMs\n{literal}"
+
+
+def test_summarization_template_keeps_braces_in_instructions():
+    prompt = news_generator._SUMMARIZATION_TEMPLATE.substitute(
+        formatted_news="1. News item",
+        instructions="Return JSON like {\"title\": ...} for {topics}"
+    )
+    assert "1. News item" in prompt
+    assert "Return JSON like {\"title\": ...} for {topics}" in prompt
+
+
+@pytest.fixture
+def search_generator(generator):
+    generator.enable_web_search = True
+    generator.search_tool = FakeSearchTool()
+    return generator
+
+
+def _tool_results(request):
+    return request[-1]["content"]
+
+
+def test_repeated_query_in_one_turn_is_searched_once(search_generator):
+    messages = ScriptedMessages([tool_use_turn("AI news", " ai NEWS "), end_turn()])
+    search_generator.client = SimpleNamespace(messages=messages)
+
+    assert search_generator.generate_news_digest(["AI"], TEMPLATE, cache_enabled=False) == "digest"
+    assert search_generator.search_tool.queries == ["AI news"]
+    first, second = _tool_results(messages.requests[1])
+    assert first["content"] == second["content"]
+    assert first["content"].startswith("Search results for 'AI news'")
+
+
+def test_repeated_query_in_later_turn_reuses_results(search_generator):
+    messages = ScriptedMessages([tool_use_turn("AI news"), tool_use_turn("AI News"), end_turn()])
+    search_generator.client = SimpleNamespace(messages=messages)
+
+    search_generator.generate_news_digest(["AI"], TEMPLATE, cache_enabled=False)
+    assert search_generator.search_tool.queries == ["AI news"]
+    assert _tool_results(messages.requests[2])[0]["content"] == _tool_results(messages.requests[1])[0]["content"]
+
+
+def test_empty_results_are_searched_again(search_generator):
+    search_generator.search_tool = FakeSearchTool(results=[])
+    messages = ScriptedMessages([tool_use_turn("AI news"), tool_use_turn("AI news"), end_turn()])
+    search_generator.client = SimpleNamespace(messages=messages)
+
+    search_generator.generate_news_digest(["AI"], TEMPLATE, cache_enabled=False)
+    assert search_generator.search_tool.queries == ["AI news", "AI news"]
+
+
+def _tool_turn(tool_use_id):
+    return [
+        {"role": "assistant", "content": [{"type": "tool_use", "id": tool_use_id}]},
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": tool_use_id, "content": "full results"}]},
+    ]
+
+
+def test_compact_tool_results_keeps_prompt_and_recent_turns():
+    messages = [{"role": "user", "content": "prompt"}]
+    for tool_use_id in ("a", "b", "c"):
+        messages.extend(_tool_turn(tool_use_id))
+    summaries = {"a": "summary a", "b": "summary b", "c": "summary c"}
+
+    news_generator._compact_tool_results(messages, summaries)
+
+    assert messages[0]["content"] == "prompt"
+    assert messages[2]["content"][0]["content"] == "summary a"
+    assert messages[4]["content"][0]["content"] == "full results"
+    assert messages[6]["content"][0]["content"] == "full results"
+
+
+def test_agent_loop_resends_older_results_as_summaries(search_generator):
+    messages = ScriptedMessages([
+        tool_use_turn("first"), tool_use_turn("second"), tool_use_turn("third"), end_turn()
+    ])
+    search_generator.client = SimpleNamespace(messages=messages)
+
+    search_generator.generate_news_digest(["AI"], TEMPLATE, cache_enabled=False)
+    last_request = messages.requests[-1]
+    assert last_request[2]["content"][0]["content"] == "[Earlier search for 'first' returned 1 results]"
+    assert last_request[4]["content"][0]["content"].startswith("Search results for 'second'")
+    assert last_request[6]["content"][0]["content"].startswith("Search results for 'third'")
+
+
+def test_multilingual_digest_splits_sections(generator):
+    messages = ScriptedMessages([end_turn("===LANG:en===\nHello\n===LANG:zh===\n你好\n")])
+    generator.client = SimpleNamespace(messages=messages)
+
+    digests = generator.generate_multilingual_digest(["AI"], TEMPLATE, ["en", "ZH"], cache_enabled=False)
+    assert digests == {"en": "Hello", "zh": "你好"}
+    assert messages.streamed == [False]
+
+
+def test_multilingual_digest_generates_missing_sections_individually(generator):
+    messages = ScriptedMessages([end_turn("===LANG:en===\nHello\n"), end_turn("Bonjour")])
+    generator.client = SimpleNamespace(messages=messages)
+
+    digests = generator.generate_multilingual_digest(["AI"], TEMPLATE, ["en", "fr"], cache_enabled=False)
+    assert digests == {"en": "Hello", "fr": "Bonjour"}
+    assert "French" in str(messages.requests[1])
+
+
+def test_multilingual_digest_rejects_language(generator):
+    with pytest.raises(ValueError, match="languages"):
+        generator.generate_multilingual_digest(["AI"], TEMPLATE, ["en", "fr"], language="fr")
+
+
+def test_multilingual_digest_streams_large_requests(generator):
+    codes = ["en", "zh", "es", "fr", "ja", "de", "ko", "pt", "it", "ru", "ar"]
+    text = "".join(f"===LANG:{code}===\nDigest {code}\n" for code in codes)
+    messages = ScriptedMessages([end_turn(text)])
+    generator.client = SimpleNamespace(messages=messages)
+
+    digests = generator.generate_multilingual_digest(["AI"], TEMPLATE, codes, cache_enabled=False)
+    assert digests["ar"] == "Digest ar"
+    assert messages.streamed == [True]
+
+
+def test_single_language_passes_max_tokens(generator, monkeypatch):
+    calls = []
+    monkeypatch.setattr(generator, "generate_news_digest", lambda *args, **kwargs: calls.append(kwargs) or "digest")
+
+    assert generator.generate_multilingual_digest(["AI"], TEMPLATE, ["ja"], max_tokens=500) == {"ja": "digest"}
+    assert calls == [{"language": "ja", "max_tokens": 500}]
+
+
+def test_generators_share_a_client_per_api_key():
+    first = NewsGenerator(api_key="shared-key")
+    assert NewsGenerator(api_key="shared-key").client is first.client
+    assert NewsGenerator(api_key="other-key").client is not first.client
+
+
+def test_close_clients_closes_pooled_clients(monkeypatch):
+    monkeypatch.setattr(news_generator, "_CLIENTS", {})
+    first = NewsGenerator(api_key="shared-key")
+
+    news_generator.close_clients()
+    assert first.client.is_closed()
+    assert NewsGenerator(api_key="shared-key").client is not first.client
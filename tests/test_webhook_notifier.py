@@ -0,0 +1,63 @@
+"""
+Tests for the webhook notifier
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from src.notifiers import webhook_notifier
+from src.notifiers.webhook_notifier import WebhookNotifier, _JitteredRetry
+
+
+@pytest.fixture
+def webhook_server():
+    """Local webhook endpoint answering with queued (status, headers) responses"""
+    responses = []
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])))
+            status, headers = responses.pop(0) if responses else (200, {})
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield SimpleNamespace(url=f"http://127.0.0.1:{server.server_port}/hook", responses=responses, received=received)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(webhook_notifier.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_retry_after_is_capped():
+    retry = _JitteredRetry(total=3)
+    assert retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "3600"})) == 30.0
+    assert retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "2"})) == 2.0
+    assert retry.get_retry_after(SimpleNamespace(headers={})) is None
+
+
+def test_requests_path_caps_retry_after(webhook_server, sleeps, monkeypatch):
+    monkeypatch.setattr(WebhookNotifier, "_create_http2_client", lambda self: None)
+    webhook_server.responses.append((429, {"Retry-After": "3600"}))
+    notifier = WebhookNotifier(webhook_server.url)
+
+    assert notifier.send("digest", title="Title")
+    assert len(webhook_server.received) == 2
+    assert sleeps == [30.0]
+    notifier.close()